@@ -0,0 +1,3030 @@
+// ========================================
+// STATE MANAGEMENT
+// ========================================
+const CONFIG = {
+    dataUrl: 'data/public_data.json',
+    initialUrl: 'data/initial.json',
+    pageSize: 25,
+};
+
+const state = {
+    allArticles: [],
+    filteredArticles: [],
+    storyClusters: [],
+    categorySummaries: {},
+    bigPicture: '',
+    bigPictureItems: [],
+    currentPage: 1,
+    totalPages: 1,
+    filters: {
+        time: 'all',
+        priority: 'all',
+        stage: 'all',
+        category: null,
+        domain: null,
+        subcategory: null,
+        search: '',
+    },
+    lastVisit: null,
+    focusedArticleIndex: -1,
+    isFullyLoaded: false,
+    sourcesInspected: 0,
+    trendingTopics: [],
+    sourcesCited: 0,
+    lastUpdated: null,
+};
+
+// Expose state globally for enhancement modules
+window.state = state;
+
+// ========================================
+// INITIALIZATION
+// ========================================
+document.addEventListener('DOMContentLoaded', async () => {
+    initTheme();
+    initReadingList();
+    loadFiltersFromURL();
+    checkNewArticles();
+    setTimeout(showUpscBubble, 1500);
+    await loadDataProgressively();
+    setupKeyboardShortcuts();
+});
+
+// ========================================
+// PROGRESSIVE DATA LOADING
+// ========================================
+// One pass over freshly-loaded articles caching derived fields that
+// filters and renders would otherwise recompute on every invocation.
+// Also collects the aggregates (unique sources, official count) that
+// used to be separate full passes over the article list.
+function precomputeArticleFields(articles) {
+    sourcePillsCache.clear();
+    const sources = new Set();
+    const counts = new Map();
+    let officialCount = 0;
+    articles.forEach(a => {
+        a._isOfficial = a.content_type === 'gazette' ||
+            a.content_type === 'press_release' ||
+            a.source_type === 'Government';
+        if (a._isOfficial) officialCount++;
+        if (a.source_name) sources.add(a.source_name);
+        // Epoch millis for date filters — parsing the ISO string once
+        // here beats a Date allocation per article per filter run.
+        a._ts = a.publication_date ? (Date.parse(a.publication_date) || 0) : 0;
+        // Truncated summaries are stable, so compute them once rather
+        // than on every card re-render (filter changes, pagination).
+        a._summaryShort = a.summary ? truncate(a.summary, 200) : '';
+        a._contextShort = a.context_summary ? truncate(a.context_summary, 200) : '';
+        // Source badge classification runs several regexes — resolve
+        // it once per article instead of once per rendered card.
+        a._sourceBadge = getSourceType(a.source_name);
+        // Combined haystack for search, built once instead of per article
+        // on every keystroke in searchArticles.
+        a._searchText = `${a.title || ''} ${a.summary || ''} ${a.source_name || ''} ${a.category || ''}`;
+        if (a.categories) {
+            a.categories.forEach(c => counts.set(c, (counts.get(c) || 0) + 1));
+        }
+    });
+    categoryCounts = counts;
+    return { sources, officialCount };
+}
+
+async function loadDataProgressively() {
+    try {
+        // Try to load initial data first (faster)
+        try {
+            const initialResponse = await fetch(CONFIG.initialUrl);
+            if (initialResponse.ok) {
+                const initial = await initialResponse.json();
+
+                // Render initial data immediately
+                if (initial.stats) {
+                    updateStatsFromData(initial.stats);
+                }
+                if (initial.top_articles) {
+                    state.allArticles = initial.top_articles;
+                    precomputeArticleFields(state.allArticles);
+                    applyFiltersAndRender();
+                }
+
+                updateLastUpdated(initial.last_updated);
+            }
+        } catch (e) {
+            console.log('Initial data not available, loading full data...');
+        }
+
+        // Load full dataset
+        const response = await fetch(CONFIG.dataUrl);
+        if (!response.ok) throw new Error('Failed to load data');
+
+        const data = await response.json();
+
+        state.allArticles = data.articles || [];
+        const articleStats = precomputeArticleFields(state.allArticles);
+        state.storyClusters = data.story_clusters || [];
+        state.categorySummaries = data.category_summaries || {};
+        state.bigPicture = data.big_picture || '';
+        state.bigPictureItems = data.big_picture_items || [];
+        state.isFullyLoaded = true;
+        state.lastUpdated = data.last_updated || null;
+        if (data.sources_inspected) {
+            state.sourcesInspected = data.sources_inspected;
+        }
+
+        // Sources cited and official count come from the precompute pass
+        state.sourcesCited = articleStats.sources.size;
+        const countEl = document.getElementById('official-count');
+        if (countEl) countEl.textContent = `(${articleStats.officialCount})`;
+
+        // Extract trending topics from articles
+        state.trendingTopics = extractTrendingTopics(state.allArticles);
+
+        updateStats();
+        renderBigPicture();
+        renderFeaturedStories();
+        renderCategoryBriefingsGrid();
+        renderSignalWidget(state.allArticles);
+        renderTopCategoryBar();
+
+        // Activate domain/sourceType UI from URL params
+        if (state.filters.domain) {
+            const domainPill = document.querySelector(`.domain-pill[data-domain="${state.filters.domain}"]`);
+            if (domainPill) {
+                document.querySelectorAll('.domain-pill').forEach(p => p.classList.remove('active'));
+                domainPill.classList.add('active');
+                setDomainFilter(state.filters.domain, domainPill);
+            }
+        }
+        if (state.filters.sourceType) {
+            const stPill = document.querySelector(`.source-type-pill[data-source-type="${state.filters.sourceType}"]`);
+            if (stPill) {
+                document.querySelectorAll('.source-type-pill').forEach(p => p.classList.remove('active'));
+                stPill.classList.add('active');
+                if (state.filters.sourceType !== 'Official') {
+                    populateSourceNames(state.filters.sourceType);
+                    document.getElementById('source-name-row').style.display = 'flex';
+                }
+            }
+        }
+
+        // Activate UPSC view if ?upsc= param present
+        if (window._activateUpscOnLoad) {
+            toggleUpscView();
+            delete window._activateUpscOnLoad;
+        }
+
+        applyFiltersAndRender();
+        updateLastUpdated(data.last_updated);
+
+        // Mark articles as new since last visit
+        markNewArticles();
+
+        // Show fully loaded indicator
+        showFullyLoadedIndicator();
+
+    } catch (error) {
+        console.error('Error loading data:', error);
+        showError('Failed to load data. Please refresh the page.');
+    }
+}
+
+function showFullyLoadedIndicator() {
+    const indicator = document.createElement('span');
+    indicator.className = 'loaded-indicator';
+    indicator.textContent = ' ✓ All data loaded';
+    document.querySelector('.filter-summary')?.appendChild(indicator);
+}
+
+// ========================================
+// NEW ARTICLES TRACKING
+// ========================================
+function checkNewArticles() {
+    state.lastVisit = localStorage.getItem('policyradar_last_visit');
+    localStorage.setItem('policyradar_last_visit', new Date().toISOString());
+}
+
+function markNewArticles() {
+    if (!state.lastVisit) return;
+
+    const lastVisitTs = new Date(state.lastVisit).getTime();
+    let newCount = 0;
+
+    state.allArticles.forEach(article => {
+        if (article.publication_date) {
+            const ts = article._ts !== undefined ? article._ts : Date.parse(article.publication_date);
+            article.isNew = ts > lastVisitTs;
+            if (article.isNew) newCount++;
+        }
+    });
+
+    if (newCount > 0) {
+        showNewArticlesBanner(newCount);
+    }
+}
+
+function showNewArticlesBanner(count) {
+    const existing = document.querySelector('.new-articles-banner');
+    if (existing) return;
+
+    const banner = document.createElement('div');
+    banner.className = 'new-articles-banner';
+    banner.innerHTML = `
+        <span>✨ ${count} new article${count > 1 ? 's' : ''} since your last visit</span>
+        <button onclick="filterNewArticles()">Show new only</button>
+        <button class="close-banner" onclick="this.parentElement.remove()">×</button>
+    `;
+
+    const filterContent = document.querySelector('.filter-content');
+    filterContent.insertBefore(banner, filterContent.firstChild);
+}
+
+function filterNewArticles() {
+    state.filters.newOnly = true;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+    document.querySelector('.new-articles-banner')?.remove();
+}
+
+// ========================================
+// URL-BASED FILTER PERSISTENCE
+// ========================================
+function loadFiltersFromURL() {
+    const params = new URLSearchParams(window.location.search);
+
+    if (params.has('time')) {
+        state.filters.time = params.get('time');
+        updateFilterButtonState('time', state.filters.time);
+    }
+    if (params.has('priority')) {
+        state.filters.priority = params.get('priority');
+        updateFilterButtonState('priority', state.filters.priority);
+    }
+    if (params.has('category')) {
+        state.filters.category = params.get('category');
+    }
+    if (params.has('domain')) {
+        state.filters.domain = params.get('domain');
+    }
+    if (params.has('sourceType')) {
+        state.filters.sourceType = params.get('sourceType');
+    }
+    if (params.has('upsc')) {
+        // Defer UPSC toggle until after data loads and pills render
+        window._activateUpscOnLoad = true;
+    }
+    if (params.has('q')) {
+        state.filters.search = params.get('q');
+        document.getElementById('search-input').value = state.filters.search;
+        const msi = document.getElementById('mobile-search-input');
+        if (msi) msi.value = state.filters.search;
+        document.getElementById('clear-search-btn').classList.remove('hidden');
+        document.getElementById('search-kbd').style.display = 'none';
+
+        // Focus mode: hide overview sections, show only filtered articles
+        ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+            const el = document.getElementById(id);
+            if (el) el.style.display = 'none';
+        });
+        // Hide newsletter banner (no id, use class)
+        document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = 'none');
+        // Hide sidebar
+        document.querySelectorAll('.sidebar').forEach(el => el.style.display = 'none');
+        // Make article feed full width
+        const mainEl = document.getElementById('main-content');
+        if (mainEl) mainEl.style.gridTemplateColumns = '1fr';
+
+        // Add back-to-intel link
+        const backLink = document.createElement('a');
+        backLink.href = 'intelligence.html';
+        backLink.className = 'back-to-intel';
+        backLink.innerHTML = '← Back to Intelligence';
+        backLink.style.cssText = 'display:inline-block;margin-bottom:1rem;font-size:0.875rem;font-weight:500;color:var(--accent-primary);text-decoration:none;';
+        const feedSection = document.querySelector('.feed-section') || mainEl;
+        if (feedSection) feedSection.prepend(backLink);
+    }
+
+    // Focus mode for deep links (?domain=, ?category=, ?sourceType=)
+    if ((params.has('domain') || params.has('category') || params.has('sourceType')) && !params.has('q')) {
+        ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+            const el = document.getElementById(id);
+            if (el) el.style.display = 'none';
+        });
+        document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = 'none');
+        document.querySelectorAll('.sidebar').forEach(el => el.style.display = 'none');
+        const mainEl = document.getElementById('main-content');
+        if (mainEl) mainEl.style.gridTemplateColumns = '1fr';
+
+        const filterLabel = params.get('domain') || params.get('category') || params.get('sourceType');
+        const backLink = document.createElement('a');
+        backLink.href = '/';
+        backLink.className = 'back-to-full';
+        backLink.innerHTML = '← Back to Policy Pulse';
+        backLink.style.cssText = 'display:inline-block;margin-bottom:1rem;font-size:0.875rem;font-weight:500;color:var(--accent-primary);text-decoration:none;';
+        const feedSection = document.querySelector('.feed-section') || mainEl;
+        if (feedSection) feedSection.prepend(backLink);
+    }
+}
+
+function updateURLParams() {
+    const params = new URLSearchParams();
+
+    if (state.filters.time !== 'all') params.set('time', state.filters.time);
+    if (state.filters.priority !== 'all') params.set('priority', state.filters.priority);
+    if (state.filters.category) params.set('category', state.filters.category);
+    if (state.filters.domain) params.set('domain', state.filters.domain);
+    if (state.filters.sourceType) params.set('sourceType', state.filters.sourceType);
+    if (state.filters.search) params.set('q', state.filters.search);
+
+    const newURL = params.toString() 
+        ? `${window.location.pathname}?${params}` 
+        : window.location.pathname;
+
+    window.history.replaceState({}, '', newURL);
+}
+
+function updateFilterButtonState(type, value) {
+    document.querySelectorAll(`.filter-btn[data-${type}]`).forEach(btn => {
+        const isActive = btn.dataset[type] === value;
+        btn.classList.toggle('active', isActive);
+        btn.setAttribute('aria-checked', isActive);
+    });
+}
+
+// ========================================
+// FILTERING
+// ========================================
+function applyFiltersAndRender() {
+    let articles = [...state.allArticles];
+
+    // Time filter
+    if (state.filters.time !== 'all') {
+        const now = new Date();
+        const cutoff = new Date();
+        if (state.filters.time === 'today') {
+            cutoff.setHours(0, 0, 0, 0);
+        } else if (state.filters.time === 'week') {
+            cutoff.setDate(now.getDate() - 7);
+        }
+        const cutoffTs = cutoff.getTime();
+        articles = articles.filter(a => a._ts >= cutoffTs);
+    }
+
+    // Priority filter
+    if (state.filters.priority !== 'all') {
+        if (state.filters.priority === 'critical') {
+            articles = articles.filter(a => a.priority_class === 'critical');
+        } else if (state.filters.priority === 'high') {
+            articles = articles.filter(a => a.priority_class === 'high');
+        }
+    }
+
+    // Policy Stage filter
+    if (state.filters.stage !== 'all') {
+        articles = articles.filter(a => a.llm_policy_stage === state.filters.stage);
+    }
+
+    // Category filter (checks primary + additional categories via categories array)
+    if (state.filters.category) {
+        articles = articles.filter(a => a.categories && a.categories.includes(state.filters.category));
+    }
+
+    // Domain filter (filters by category groups)
+    if (state.filters.domain) {
+        const activeDomains = isUpscView ? UPSC_DOMAIN_SETS : DOMAIN_CATEGORY_SETS;
+        const domainCategories = activeDomains[state.filters.domain];
+        if (domainCategories) {
+            articles = articles.filter(a => a.categories && a.categories.some(c => domainCategories.has(c)));
+        }
+    }
+
+    // Subcategory filter (filters by specific category)
+    if (currentSelectedCategory) {
+        articles = articles.filter(a => a.categories && a.categories.includes(currentSelectedCategory));
+    }
+
+    // Source type filter
+    if (state.filters.sourceType) {
+        if (state.filters.sourceType === 'Official') {
+            articles = articles.filter(a => a._isOfficial);
+        } else {
+            articles = articles.filter(a => a.source_type === state.filters.sourceType);
+        }
+    }
+
+    // Source name filter (specific publication)
+    if (state.filters.sourceName) {
+        articles = articles.filter(a => a.source_name === state.filters.sourceName);
+    }
+
+    // Search filter
+    if (state.filters.search) {
+        articles = searchArticles(articles, state.filters.search);
+    }
+
+    // New only filter
+    if (state.filters.newOnly) {
+        articles = articles.filter(a => a.isNew);
+    }
+
+    state.filteredArticles = articles;
+    state.totalPages = Math.ceil(articles.length / CONFIG.pageSize);
+    state.currentPage = Math.min(state.currentPage, Math.max(1, state.totalPages));
+
+    renderArticles();
+    renderPagination();
+    updateFilterCount();
+    updateURLParams();
+
+    // Announce to screen readers
+    announce(`Showing ${articles.length} articles`);
+}
+
+function searchArticles(articles, query) {
+    if (!query) return articles;
+    const terms = query.toLowerCase().split(/\s+/).filter(t => t.length > 0);
+    // Use word-boundary matching to prevent substring matches (e.g. "ITAT" matching "facilitated")
+    const patterns = terms.map(term => {
+        const escaped = term.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+        return new RegExp('\\b' + escaped + '\\b', 'i');
+    });
+    return articles.filter(article => patterns.every(re => re.test(article._searchText)));
+}
+
+function setTimeFilter(value, element) {
+    document.querySelectorAll('.filter-btn[data-time]').forEach(btn => {
+        btn.classList.remove('active');
+        btn.setAttribute('aria-checked', 'false');
+    });
+    element.classList.add('active');
+    element.setAttribute('aria-checked', 'true');
+    state.filters.time = value;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+}
+
+function setPriorityFilter(value, element) {
+    document.querySelectorAll('.filter-btn[data-priority]').forEach(btn => {
+        btn.classList.remove('active');
+        btn.setAttribute('aria-checked', 'false');
+    });
+    element.classList.add('active');
+    element.setAttribute('aria-checked', 'true');
+    state.filters.priority = value;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+}
+
+function setStageFilter(value, element) {
+    document.querySelectorAll('.filter-btn[data-stage]').forEach(btn => {
+        btn.classList.remove('active');
+        btn.setAttribute('aria-checked', 'false');
+    });
+    element.classList.add('active');
+    element.setAttribute('aria-checked', 'true');
+    state.filters.stage = value;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+}
+
+function syncSearch(query) {
+    const desktop = document.getElementById('search-input');
+    const mobile = document.getElementById('mobile-search-input');
+    if (desktop) desktop.value = query;
+    if (mobile) mobile.value = query;
+    handleSearch(query);
+}
+
+let searchTimeout = null;
+function handleSearch(query) {
+    clearTimeout(searchTimeout);
+
+    const clearBtn = document.getElementById('clear-search-btn');
+    const kbd = document.getElementById('search-kbd');
+
+    if (query.length > 0) {
+        clearBtn.classList.remove('hidden');
+        kbd.style.display = 'none';
+    } else {
+        clearBtn.classList.add('hidden');
+        kbd.style.display = 'block';
+    }
+
+    searchTimeout = setTimeout(() => {
+        state.filters.search = query.toLowerCase().trim();
+        state.currentPage = 1;
+        hideSearchSuggestions();
+        applyFiltersAndRender();
+    }, 200);
+}
+
+function clearSearch() {
+    const input = document.getElementById('search-input');
+    const mobileInput = document.getElementById('mobile-search-input');
+    input.value = '';
+    if (mobileInput) mobileInput.value = '';
+    document.getElementById('clear-search-btn').classList.add('hidden');
+    document.getElementById('search-kbd').style.display = 'block';
+    hideSearchSuggestions();
+    state.filters.search = '';
+    state.currentPage = 1;
+    restoreFocusMode();
+    applyFiltersAndRender();
+}
+
+// Restore sections hidden by focus mode (?q= from Intelligence page)
+function restoreFocusMode() {
+    ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+        const el = document.getElementById(id);
+        if (el) el.style.display = '';
+    });
+    document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = '');
+    document.querySelectorAll('.sidebar').forEach(el => el.style.display = '');
+    const mainEl = document.getElementById('main-content');
+    if (mainEl) mainEl.style.gridTemplateColumns = '';
+    const backLink = document.querySelector('.back-to-intel');
+    if (backLink) backLink.remove();
+}
+
+function showSearchSuggestions() {
+    const suggestionsEl = document.getElementById('search-suggestions');
+    const input = document.getElementById('search-input');
+
+    if (!suggestionsEl || !state.allArticles.length) return;
+
+    const query = input.value.toLowerCase().trim();
+
+    // Generate suggestions
+    let html = '';
+
+    // Recent/trending keywords
+    if (state.trendingTopics && state.trendingTopics.length > 0) {
+        html += `
+            <div class="search-suggestion-group">
+                <div class="search-suggestion-label">Trending</div>
+                ${state.trendingTopics.slice(0, 4).map(t => `
+                    <div class="search-suggestion-item" onclick="selectSearchSuggestion('${escapeHtml(t.name)}')">
+                        <span class="suggestion-icon">🔍</span>
+                        <span>${escapeHtml(t.name)}</span>
+                        <span class="suggestion-category">${t.count} articles</span>
+                    </div>
+                `).join('')}
+            </div>
+        `;
+    }
+
+    // Category suggestions
+    const categories = Object.keys(CATEGORY_COLORS).slice(0, 6);
+    html += `
+        <div class="search-suggestion-group">
+            <div class="search-suggestion-label">📂 Categories</div>
+            ${categories.map(cat => `
+                <div class="search-suggestion-item" onclick="filterByCategoryFromStats('${escapeHtml(cat)}')">
+                    <span class="suggestion-icon" style="color: ${CATEGORY_COLORS[cat]}">●</span>
+                    <span>${escapeHtml(cat)}</span>
+                </div>
+            `).join('')}
+        </div>
+    `;
+
+    suggestionsEl.innerHTML = html;
+    suggestionsEl.classList.add('active');
+
+    // Hide on click outside
+    document.addEventListener('click', handleClickOutsideSuggestions);
+}
+
+function hideSearchSuggestions() {
+    const suggestionsEl = document.getElementById('search-suggestions');
+    if (suggestionsEl) {
+        suggestionsEl.classList.remove('active');
+    }
+    document.removeEventListener('click', handleClickOutsideSuggestions);
+}
+
+function handleClickOutsideSuggestions(e) {
+    const wrapper = document.querySelector('.search-wrapper');
+    if (wrapper && !wrapper.contains(e.target)) {
+        hideSearchSuggestions();
+    }
+}
+
+function selectSearchSuggestion(term) {
+    const input = document.getElementById('search-input');
+    input.value = term;
+    hideSearchSuggestions();
+    handleSearch(term);
+}
+
+function resetFilters() {
+    state.filters = {
+        time: 'all',
+        priority: 'all',
+        stage: 'all',
+        category: null,
+        domain: null,
+        subcategory: null,
+        sourceType: null,
+        sourceName: null,
+        search: '',
+        newOnly: false,
+    };
+    currentSelectedCategory = null;
+    state.currentPage = 1;
+    state.focusedArticleIndex = -1;
+
+    // Reset UI
+    document.querySelectorAll('.filter-btn[data-time]').forEach(btn => {
+        btn.classList.toggle('active', btn.dataset.time === 'all');
+    });
+    document.querySelectorAll('.filter-btn[data-priority]').forEach(btn => {
+        btn.classList.toggle('active', btn.dataset.priority === 'all');
+    });
+    document.querySelectorAll('.filter-btn[data-stage]').forEach(btn => {
+        btn.classList.toggle('active', btn.dataset.stage === 'all');
+    });
+    // Reset UPSC view if active
+    if (isUpscView) {
+        isUpscView = false;
+        document.getElementById('upsc-toggle').classList.remove('active');
+        document.getElementById('domain-pills').innerHTML = `
+            <button class="domain-pill active" data-domain="" onclick="setDomainFilter('', this)">All</button>
+            <button class="domain-pill domain-economy" data-domain="economy" onclick="setDomainFilter('economy', this)">Economy</button>
+            <button class="domain-pill domain-technology" data-domain="technology" onclick="setDomainFilter('technology', this)">Technology</button>
+            <button class="domain-pill domain-infrastructure" data-domain="infrastructure" onclick="setDomainFilter('infrastructure', this)">Infrastructure</button>
+            <button class="domain-pill domain-social" data-domain="social" onclick="setDomainFilter('social', this)">Social</button>
+            <button class="domain-pill domain-governance" data-domain="governance" onclick="setDomainFilter('governance', this)">Governance</button>
+            <button class="domain-pill domain-foreign" data-domain="foreign" onclick="setDomainFilter('foreign', this)">Foreign</button>
+        `;
+    }
+    // Reset domain pills
+    document.querySelectorAll('.domain-pill').forEach(pill => {
+        pill.classList.toggle('active', !pill.dataset.domain);
+    });
+    // Reset source type pills
+    document.querySelectorAll('.source-type-pill').forEach(pill => {
+        pill.classList.toggle('active', !pill.dataset.sourceType);
+    });
+    // Hide subsector row
+    const subsectorRow = document.getElementById('subsector-row');
+    if (subsectorRow) subsectorRow.style.display = 'none';
+    // Hide source name row
+    const sourceNameRow = document.getElementById('source-name-row');
+    if (sourceNameRow) sourceNameRow.style.display = 'none';
+
+    document.getElementById('search-input').value = '';
+    document.getElementById('clear-search-btn').classList.add('hidden');
+    document.getElementById('search-kbd').style.display = 'block';
+    document.querySelector('.new-articles-banner')?.remove();
+
+    applyFiltersAndRender();
+}
+
+function setSourceTypeFilter(sourceType, element) {
+    // Update UI
+    document.querySelectorAll('.source-type-pill').forEach(pill => {
+        pill.classList.remove('active');
+    });
+    element.classList.add('active');
+
+    // Update state
+    state.filters.sourceType = sourceType || null;
+    state.filters.sourceName = null; // Reset source name when type changes
+    state.currentPage = 1;
+
+    // Focus mode: hide overview sections when filtered, restore on "All"
+    const hasAnyFilter = sourceType || state.filters.domain;
+    ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+        const el = document.getElementById(id);
+        if (el) el.style.display = hasAnyFilter ? 'none' : '';
+    });
+    document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = hasAnyFilter ? 'none' : '');
+    const mainEl = document.getElementById('main-content');
+    if (mainEl) mainEl.style.gridTemplateColumns = hasAnyFilter ? '1fr' : '';
+    document.querySelectorAll('.sidebar').forEach(el => el.style.display = hasAnyFilter ? 'none' : '');
+
+    // Hide category summary when source type changes (summaries are pre-generated, don't match filter)
+    const catSummaryRow = document.getElementById('category-summary-row');
+    if (catSummaryRow && sourceType) catSummaryRow.style.display = 'none';
+
+    // Show/hide source name filter row
+    const sourceNameRow = document.getElementById('source-name-row');
+    if (sourceType) {
+        // Populate source names for this type
+        populateSourceNames(sourceType);
+        sourceNameRow.style.display = 'flex';
+    } else {
+        sourceNameRow.style.display = 'none';
+    }
+
+    applyFiltersAndRender();
+}
+
+// Rendered pill markup per source type. The article set only changes
+// on data load, so re-selecting a type reuses the cached markup;
+// precomputeArticleFields clears the cache when new data arrives.
+const sourcePillsCache = new Map();
+
+// Article count per category, refreshed by the precompute pass. The
+// subcategory pill builders used to rescan every article per category
+// on each domain selection just to label the chips.
+let categoryCounts = new Map();
+
+function populateSourceNames(sourceType) {
+    const container = document.getElementById('source-name-pills');
+    if (!container) return;
+
+    const cached = sourcePillsCache.get(sourceType);
+    if (cached !== undefined) {
+        container.innerHTML = cached;
+        return;
+    }
+
+    // Get unique sources of this type with counts
+    const sourceCounts = {};
+    state.allArticles.forEach(article => {
+        const matches = sourceType === 'Official'
+            ? article._isOfficial
+            : (article.source_type === sourceType);
+        if (matches) {
+            const name = article.source_name;
+            sourceCounts[name] = (sourceCounts[name] || 0) + 1;
+        }
+    });
+
+    // Sort by count descending
+    const sortedSources = Object.entries(sourceCounts)
+        .sort((a, b) => b[1] - a[1]);
+
+    // Generate pills — collected in an array and joined once, rather
+    // than growing a string per source
+    const pills = [`<button class="source-name-pill active" data-source-name="" onclick="setSourceNameFilter('', this)">All</button>`];
+    sortedSources.forEach(([name, count]) => {
+        // Shorten long names
+        const displayName = name.length > 25 ? name.substring(0, 22) + '...' : name;
+        pills.push(`<button class="source-name-pill" data-source-name="${name}" onclick="setSourceNameFilter('${name.replace(/'/g, "\\'")}', this)" title="${name}">${displayName} <span class="source-count">(${count})</span></button>`);
+    });
+
+    const html = pills.join('');
+    sourcePillsCache.set(sourceType, html);
+    container.innerHTML = html;
+}
+
+function setSourceNameFilter(sourceName, element) {
+    // Update UI
+    document.querySelectorAll('.source-name-pill').forEach(pill => {
+        pill.classList.remove('active');
+    });
+    element.classList.add('active');
+
+    // Update state
+    state.filters.sourceName = sourceName || null;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+}
+
+function updateFilterCount() {
+    const count = state.filteredArticles.length;
+    const total = state.allArticles.length;
+
+    const countEl = document.getElementById('filter-count');
+    const showingEl = document.getElementById('articles-showing');
+    const clearAllBtn = document.getElementById('clear-all-filters');
+
+    const text = count === total 
+        ? `${count} articles` 
+        : `${count} of ${total} articles`;
+
+    countEl.textContent = text;
+    showingEl.textContent = text;
+
+    // Show clear all button if any filter is active
+    const hasActiveFilters =
+        state.filters.time !== 'all' ||
+        state.filters.priority !== 'all' ||
+        state.filters.category ||
+        state.filters.sourceType ||
+        state.filters.sourceName ||
+        state.filters.search ||
+        state.filters.newOnly;
+
+    clearAllBtn.style.display = hasActiveFilters ? 'block' : 'none';
+
+    // Update mobile badge
+    const activeCount = [
+        state.filters.time !== 'all',
+        state.filters.priority !== 'all',
+        state.filters.category,
+        state.filters.sourceType,
+        state.filters.sourceName,
+    ].filter(Boolean).length;
+
+    const mobileBadge = document.getElementById('active-filter-count');
+    if (activeCount > 0) {
+        mobileBadge.textContent = activeCount;
+        mobileBadge.style.display = 'block';
+    } else {
+        mobileBadge.style.display = 'none';
+    }
+
+    // Show active search chip
+    const searchChip = document.getElementById('active-search-chip');
+    const searchLabel = document.getElementById('active-search-label');
+    if (state.filters.search) {
+        searchLabel.textContent = state.filters.search;
+        searchChip.classList.add('visible');
+    } else {
+        searchChip.classList.remove('visible');
+    }
+}
+
+function clearSearchFilter() {
+    const searchInput = document.getElementById('search-input');
+    searchInput.value = '';
+    restoreFocusMode();
+    handleSearch('');
+}
+
+// ========================================
+// RENDERING
+// ========================================
+// One delegated listener covers the bookmark/share buttons on every card,
+// instead of a pair of inline handler strings allocated per rendered card.
+// The article is resolved from the card's data-index into filteredArticles.
+document.addEventListener('DOMContentLoaded', () => {
+    const grid = document.getElementById('articles-grid');
+    if (!grid) return;
+    grid.addEventListener('click', (e) => {
+        const btn = e.target.closest('[data-action]');
+        if (!btn || !grid.contains(btn)) return;
+        const card = btn.closest('.article-card');
+        const article = card && state.filteredArticles[Number(card.dataset.index)];
+        if (!article) return;
+        if (btn.dataset.action === 'bookmark') {
+            toggleReadingList(e, article.url, article.title, article.source_name || '');
+        } else if (btn.dataset.action === 'share') {
+            shareArticle(e, article.url, article.title);
+        }
+    });
+});
+
+function renderArticles() {
+    const container = document.getElementById('articles-grid');
+    const articles = state.filteredArticles;
+
+    // Remove loading skeleton
+    document.getElementById('loading-skeleton')?.remove();
+    container.setAttribute('aria-busy', 'false');
+
+    if (articles.length === 0) {
+        container.innerHTML = `
+            <div class="empty-state">
+                <div class="empty-state-icon">📭</div>
+                <h3 class="empty-state-title">No articles match your filters</h3>
+                <p class="empty-state-description">
+                    Try adjusting your search terms or removing some filters to see more results.
+                </p>
+                <div class="empty-state-actions">
+                    <button class="btn btn-primary" onclick="resetFilters()">Clear all filters</button>
+                </div>
+            </div>
+        `;
+        return;
+    }
+
+    // Paginate
+    const start = (state.currentPage - 1) * CONFIG.pageSize;
+    const end = start + CONFIG.pageSize;
+    const pageArticles = articles.slice(start, end);
+
+    const subscribed = localStorage.getItem('policyradar_subscribed') === '1';
+    container.innerHTML = pageArticles.map((article, index) => {
+        const globalIndex = start + index;
+        let html = renderArticleCard(article, globalIndex);
+        if (!subscribed && (index + 1) % 15 === 0) {
+            html += `<a href="https://policyradar.beehiiv.com/subscribe" target="_blank" rel="noopener" class="inline-newsletter-cta" onclick="markSubscribed()">
+                <div class="inline-newsletter-cta-text"><strong>Policy moves fast.</strong> Stay informed in one weekly email.</div>
+                <span class="inline-newsletter-cta-btn">Subscribe</span>
+            </a>`;
+        }
+        return html;
+    }).join('');
+
+    // Update bookmark button states
+    updateBookmarkButtons();
+}
+
+function renderArticleCard(article, index) {
+    const priorityClass = article.priority_class || 'medium';
+    const priorityLabel = priorityClass === 'critical' ? 'Top' :
+                          priorityClass === 'high' ? 'High' : '';
+    const isNew = article.isNew ? 'new' : '';
+    const sourceCount = article.source_count || 1;
+    const isMultiSource = sourceCount >= 3;
+
+    return `
+        <article class="article-card ${isNew} ${isMultiSource ? 'multi-source' : ''}"
+                 data-impact="${priorityClass}"
+                 data-index="${index}"
+                 tabindex="0"
+                 aria-labelledby="article-title-${index}">
+            <div class="article-header">
+                <div class="article-meta">
+                    <a href="${escapeHtml(article.url)}"
+                       class="article-source"
+                       target="_blank"
+                       rel="noopener">
+                        ${escapeHtml(article.source_name || 'Unknown')}
+                    </a>${(() => { const st = article._sourceBadge; const ct = article.content_type; let badges = ''; if (ct === 'gazette') badges += ' <span class="source-type-badge source-type-gazette">GAZETTE</span>'; else if (st) badges += ` <span class="source-type-badge source-type-${st.cls}">${st.label}</span>`; return badges; })()}
+                    <span class="article-separator">•</span>
+                    <time class="article-date" datetime="${article.publication_date}">
+                        ${formatDate(article.publication_date)}
+                    </time>
+                    ${isMultiSource ? `
+                        <span class="article-separator">•</span>
+                        <span class="multi-source-badge" title="Covered by ${sourceCount} sources">
+                            📰 ${sourceCount} sources
+                        </span>
+                    ` : ''}
+                </div>
+                ${priorityLabel ? `
+                    <span class="article-priority" aria-label="${priorityLabel} priority">
+                        ${priorityLabel}
+                    </span>
+                ` : ''}
+            </div>
+
+            <h3 class="article-title" id="article-title-${index}">
+                <a href="${escapeHtml(article.url)}" target="_blank" rel="noopener">
+                    ${escapeHtml(article.title)}
+                </a>
+            </h3>
+
+            ${article._summaryShort ? `
+                <div class="article-summaries">
+                    <p class="article-summary">${escapeHtml(article._summaryShort)}</p>
+                    ${article._contextShort ? `
+                        <div class="context-summary">
+                            <span class="context-label">In context (${escapeHtml(article.context_source || 'News')}):</span>
+                            <p>${escapeHtml(article._contextShort)}</p>
+                        </div>
+                    ` : ''}
+                </div>
+            ` : ''}
+
+            <div class="article-footer">
+                <span class="article-category">${escapeHtml(article.category || 'Governance')}</span>
+                ${article.llm_policy_stage ? `<span class="article-stage stage-${article.llm_policy_stage}">${article.llm_policy_stage}</span>` : ''}
+                <div class="article-actions">
+                    <button class="article-action bookmark-btn"
+                            data-action="bookmark"
+                            aria-label="Save to reading list"
+                            title="Save to reading list"
+                            data-url="${escapeHtml(article.url)}">
+                        📑
+                    </button>
+                    <button class="article-action"
+                            data-action="share"
+                            aria-label="Share article"
+                            title="Share">
+                        📤
+                    </button>
+                </div>
+            </div>
+        </article>
+    `;
+}
+
+function estimateReadTime(text) {
+    if (!text) return 1;
+    const words = text.split(/\s+/).length;
+    return Math.max(1, Math.ceil(words / 200));
+}
+
+function renderPagination() {
+    const container = document.getElementById('pagination');
+    if (state.totalPages <= 1) {
+        container.innerHTML = '';
+        return;
+    }
+
+    let html = `
+        <button class="pagination-btn" 
+                onclick="goToPage(${state.currentPage - 1})" 
+                ${state.currentPage === 1 ? 'disabled' : ''}
+                aria-label="Previous page">
+            ← Prev
+        </button>
+    `;
+
+    const maxVisible = 5;
+    let startPage = Math.max(1, state.currentPage - Math.floor(maxVisible / 2));
+    let endPage = Math.min(state.totalPages, startPage + maxVisible - 1);
+    if (endPage - startPage < maxVisible - 1) {
+        startPage = Math.max(1, endPage - maxVisible + 1);
+    }
+
+    if (startPage > 1) {
+        html += `<button class="pagination-btn" onclick="goToPage(1)">1</button>`;
+        if (startPage > 2) html += `<span class="pagination-info">...</span>`;
+    }
+
+    for (let i = startPage; i <= endPage; i++) {
+        html += `
+            <button class="pagination-btn ${i === state.currentPage ? 'active' : ''}" 
+                    onclick="goToPage(${i})"
+                    ${i === state.currentPage ? 'aria-current="page"' : ''}>
+                ${i}
+            </button>
+        `;
+    }
+
+    if (endPage < state.totalPages) {
+        if (endPage < state.totalPages - 1) html += `<span class="pagination-info">...</span>`;
+        html += `<button class="pagination-btn" onclick="goToPage(${state.totalPages})">${state.totalPages}</button>`;
+    }
+
+    html += `
+        <button class="pagination-btn" 
+                onclick="goToPage(${state.currentPage + 1})" 
+                ${state.currentPage === state.totalPages ? 'disabled' : ''}
+                aria-label="Next page">
+            Next →
+        </button>
+    `;
+
+    container.innerHTML = html;
+}
+
+function goToPage(page) {
+    if (page < 1 || page > state.totalPages) return;
+    state.currentPage = page;
+    state.focusedArticleIndex = -1;
+    renderArticles();
+    renderPagination();
+    document.querySelector('.articles-section').scrollIntoView({ behavior: 'smooth' });
+}
+
+// 5 Main Domains mapped to article categories
+const DOMAIN_CATEGORIES = {
+    'economy': ['Finance', 'Trade'],
+    'technology': ['Technology', 'Telecom', 'Data Privacy', 'Fintech', 'DeepTech'],
+    'infrastructure': ['Infrastructure', 'Energy', 'Environment', 'Urban'],
+    'social': ['Health', 'Education', 'Welfare', 'Agriculture', 'Labour'],
+    'governance': ['Governance', 'Legal', 'Politics', 'Civil Liberties'],
+    'foreign': ['Foreign', 'Defence']
+};
+
+// Category-based subcategories (matches article.category field)
+// ⚡ Civil Liberties is a PRIORITY category - PolicyRadar pays extra attention to fundamental rights
+const SUBCATEGORIES = {
+    'economy': ['Finance', 'Trade'],
+    'technology': ['Technology', 'Telecom', 'Data Privacy', 'Fintech', 'DeepTech'],
+    'infrastructure': ['Infrastructure', 'Energy', 'Environment', 'Urban'],
+    'social': ['Health', 'Education', 'Welfare', 'Agriculture', 'Labour'],
+    'governance': ['Governance', 'Legal', 'Politics', 'Civil Liberties'],
+    'foreign': ['Foreign', 'Defence']
+};
+
+// UPSC GS Paper groupings (category-level, no per-article tags)
+const UPSC_DOMAINS = {
+    'gs2': ['Governance', 'Legal', 'Foreign', 'Politics', 'Civil Liberties', 'Health', 'Education', 'Welfare', 'Labour'],
+    'gs3': ['Finance', 'Trade', 'Technology', 'Telecom', 'Data Privacy', 'Fintech', 'DeepTech', 'Infrastructure', 'Energy', 'Environment', 'Urban', 'Agriculture', 'Defence']
+};
+const UPSC_LABELS = {
+    'gs2': 'GS-II: Polity & Governance',
+    'gs3': 'GS-III: Economy & Security'
+};
+
+// Set mirrors of the domain groupings, built once so the per-article
+// membership test in the domain filter is a hash lookup rather than
+// an array scan for every category of every article.
+const DOMAIN_CATEGORY_SETS = Object.fromEntries(
+    Object.entries(DOMAIN_CATEGORIES).map(([k, v]) => [k, new Set(v)]));
+const UPSC_DOMAIN_SETS = Object.fromEntries(
+    Object.entries(UPSC_DOMAINS).map(([k, v]) => [k, new Set(v)]));
+
+let isUpscView = false;
+
+// Store current selected category for filtering
+let currentSelectedCategory = null;
+
+// Category colors for briefing badges - HIGH CONTRAST distinct colors
+// ⚡ Civil Liberties is a PRIORITY category - PolicyRadar pays extra attention
+const CATEGORY_COLORS = {
+    'Legal': '#7c3aed',        // Purple
+    'Foreign': '#2563eb',      // Blue
+    'Politics': '#e11d48',     // Red-Pink
+    'Finance': '#059669',      // Green
+    'Technology': '#0ea5e9',   // Sky Blue
+    'Infrastructure': '#f97316', // Orange
+    'Trade': '#06b6d4',        // Cyan
+    'Governance': '#6366f1',   // Indigo
+    'Defence': '#dc2626',      // Red
+    'Health': '#ec4899',       // Pink
+    'Energy': '#eab308',       // Yellow
+    'Environment': '#22c55e',  // Bright Green
+    'Education': '#a855f7',    // Fuchsia
+    'Telecom': '#3b82f6',      // Bright Blue
+    'Fintech': '#14b8a6',      // Teal
+    'Agriculture': '#84cc16',  // Lime
+    'Welfare': '#f59e0b',      // Amber
+    'Data Privacy': '#8b5cf6', // Violet
+    'DeepTech': '#6d28d9',     // Dark Purple
+    'Urban': '#78716c',        // Stone
+    'Labour': '#b91c1c',       // Dark Red
+    'Civil Liberties': '#be185d', // ⚡ PRIORITY - Magenta
+};
+
+// Common all-caps words to ignore during acronym extraction.
+// Built once at load — KW.extract runs once per article title, so
+// rebuilding this set per call would allocate it thousands of times.
+const COMMON_CAPS = new Set(['THE','IN','ON','AT','TO','FOR','OF','BY','AS','IS','IT','PM','CM','MP','AM','AN','US','UK','EU','II','SHRI','SMT','DR','NEW','BIG','TOP','HOW','WHY','CAN','ALL','NOW','OLD','OUR','HIS','HER','NOT','BUT','ITS','HAS','HAD','WAS','ARE','GET','GOT','SET','PUT','RAN','MET','WON','LED','CUT','HIT']);
+
+// Keyword extraction filters (shared with Intelligence Hub)
+const KW = {
+    PLACE: /^.{2,}(pur|pura|abad|garh|nagar|ganj|wadi|puram|patnam|bad|khand|vihar)$/,
+    PLACE_NAMES: /^(delhi|mumbai|chennai|kolkata|bengaluru|bangalore|hyderabad|ahmedabad|pune|jaipur|lucknow|chandigarh|bhopal|patna|ranchi|shimla|dehradun|gangtok|itanagar|kohima|imphal|agartala|aizawl|shillong|dispur|guwahati|thiruvananthapuram|srinagar|jammu|amritsar|ludhiana|noida|gurgaon|gurugram|faridabad|thane|nagpur|varanasi|kanpur|indore|coimbatore|visakhapatnam|vijayawada|madurai|rajkot|surat|vadodara|nashik|aurangabad|meerut|allahabad|prayagraj|agra|jodhpur|udaipur|kochi|kozhikode|mysuru|mangalore|hubballi|dharwad|raipur|gwalior|jabalpur|warangal|guntur|bikaner|ajmer|bhilai|tiruchirappalli|bareilly|moradabad|aligarh|gorakhpur|karnataka|maharashtra|kerala|tamil|telangana|andhra|pradesh|rajasthan|odisha|chhattisgarh|jharkhand|uttarakhand|tripura|sikkim|manipur|meghalaya|mizoram|arunachal|nagaland|assam|haryana|punjab|himachal|kashmir|bengal|gujarat|madhya|uttar|bihar|russia|china|pakistan|america|united|states|israel|ukraine|japan|germany|france|britain|england|australia|canada|iran|iraq|syria|afghanistan|bangladesh|nepal|lanka|myanmar|indonesia|saudi|arabia|turkey|brazil|mexico|africa|europe|moscow|beijing|washington|london|paris|tokyo|islamabad|kabul|tehran|taipei|brussels)$/,
+    REPORT_VERB: /^(says?|said|told?|tells?|ask(?:s|ed|ing)?|add(?:s|ed|ing)?|not(?:es?|ed|ing)|claim(?:s|ed|ing)?|alleg(?:es?|ed|ing)|announc(?:es?|ed|ing)|report(?:s|ed|ing)?|reveal(?:s|ed|ing)?|launch(?:es?|ed|ing)?|propos(?:es?|ed|ing)?|seek(?:s|ing)?|sought|call(?:s|ed|ing)?|urg(?:es?|ed|ing)|warn(?:s|ed|ing)?|declar(?:es?|ed|ing)|stat(?:es?|ed|ing)|confirm(?:s|ed|ing)?|den(?:y|ies|ied|ying)|admit(?:s|ted|ting)?|reject(?:s|ed|ing)?|dismiss(?:es|ed|ing)?|allow(?:s|ed|ing)?|ban(?:s|ned|ning)?|block(?:s|ed|ing)?|boost(?:s|ed|ing)?|slash(?:es|ed|ing)?|hik(?:es?|ed|ing)|scraps?|scrap(?:s|ped|ping)?|slam(?:s|med|ming)?|pled(?:ge[ds]?|ging)|vow(?:s|ed|ing)?|hail(?:s|ed|ing)?|laud(?:s|ed|ing)?|praise[ds]?|praising|criticis(?:es?|ed|ing)|condemn(?:s|ed|ing)?|forg(?:es?|ed|ing)|sign(?:s|ed|ing)?|adopt(?:s|ed|ing)?|ratif(?:y|ies|ied|ying)|endors(?:es?|ed|ing)|oppos(?:es?|ed|ing)|challeng(?:es?|ed|ing)|target(?:s|ed|ing)?|emerg(?:es?|ed|ing))$/,
+    ACTION_VERB: /^(get(?:s|ting)?|got|make(?:s|ing)?|made|tak(?:es?|ing)|took|taken|giv(?:es?|ing)|gave|given|come(?:s|ing)?|came|go(?:es|ing)?|went|gone|know(?:s|ing)?|knew|known|think(?:s|ing)?|thought|see(?:s|ing)?|saw|seen|want(?:s|ed|ing)?|use[ds]?|using|find(?:s|ing)?|found|put(?:s|ting)?|keep(?:s|ing)?|kept|begin(?:s|ning)?|began|begun|set(?:s|ting)?|show(?:s|ed|ing)?|shown|bring(?:s|ing)?|brought|turn(?:s|ed|ing)?|start(?:s|ed|ing)?|run(?:s|ning)?|ran|meet(?:s|ing)?|met|pay(?:s|ing)?|paid|hear(?:s|ing)?|heard|stand(?:s|ing)?|stood|leav(?:es?|ing)|left|watch(?:es|ed|ing)?|feel(?:s|ing)?|felt|becom(?:es?|ing)|became|look(?:s|ed|ing)?|build(?:s|ing)?|built|face[ds]?|facing|join(?:s|ed|ing)?|hit(?:s|ting)?|pick(?:s|ed|ing)?|back(?:s|ed|ing)?|name[ds]?|naming|help(?:s|ed|ing)?|need(?:s|ed|ing)?|creat(?:es?|ed|ing)|form(?:s|ed|ing)?|hold(?:s|ing)?|held|open(?:s|ed|ing)?|clos(?:es?|ed|ing)|includ(?:es?|ed|ing)|continu(?:es?|ed|ing)|chang(?:es?|ed|ing)|provid(?:es?|ed|ing)|receiv(?:es?|ed|ing)|remain(?:s|ed|ing)?|rais(?:es?|ed|ing)|follow(?:s|ed|ing)?|requir(?:es?|ed|ing)|decid(?:es?|ed|ing)|return(?:s|ed|ing)?|explain(?:s|ed|ing)?|develop(?:s|ed|ing)?|support(?:s|ed|ing)?|present(?:s|ed|ing)?|discuss(?:es|ed|ing)?|tr(?:y|ies|ied|ying)|win(?:s|ning)?|won|los(?:es?|ing)|lost|spend(?:s|ing)?|spent|grow(?:s|ing)?|grew|grown|stop(?:s|ped|ping)?|fall(?:s|ing)?|fell|fallen|lead(?:s|ing)?|led|speak(?:s|ing)?|spoke|spoken|accept(?:s|ed|ing)?|carr(?:y|ies|ied|ying)|happen(?:s|ed|ing)?|writ(?:es?|ing)|wrote|written|appear(?:s|ed|ing)?|cover(?:s|ed|ing)?|produc(?:es?|ed|ing)|serv(?:es?|ed|ing)|appl(?:y|ies|ied|ying)|invest(?:s|ed|ing)?|shar(?:es?|ed|ing)|arrest(?:s|ed|ing)?|search(?:es|ed|ing)?|push(?:es|ed|ing)?|defend(?:s|ed|ing)?|found(?:s|ed|ing)?|stab(?:s|bed|bing)?|bludgeon(?:s|ed|ing)?)$/,
+    MODIFIER: /^(major|minor|first|second|third|fourth|fifth|last|next|previous|current|recent|recently|early|late|soon|later|earlier|ahead|latest|today|coming|total|overall|entire|whole|final|initial|basic|simple|strong|weak|likely|unlikely|possible|necessary|available|ready|clear|right|wrong|special|general|specific|certain|various|different|similar|other|important|significant|critical|crucial|essential|primary|secondary|political|national|international|local|global|foreign|domestic|regional|public|private|social|economic|financial|official|legal|civic|former|under|above|below|after|before|across|along|behind|beyond|without|within|according|another|every|further|higher|lower|biggest|largest|biggest|smallest|greater|disappointing|conditioning|disorganised|disorganized|extremely)$/,
+    GENERIC_NOUN: /^(government|minister|ministry|official|authority|department|committee|commission|council|agency|board|office|leader|member|people|person|citizen|country|nation|state|union|centre|center|action|issue|matter|party|group|team|system|level|area|region|number|point|place|result|effect|impact|reason|cause|problem|solution|question|answer|decision|agreement|meeting|session|report|study|survey|review|analysis|details?|records?|sources?|benefits?|challenges?|opportunity|concern|interest|target|effort|attempt|measures?|schemes?|projects?|programs?|initiatives?|mission|vision|statements?|comments?|responses?|messages?|services?|sectors?|markets?|industry|company|business|growth|development|progress|process|reform|change|increase|decrease|crisis|situation|condition|status|events?|incidents?|cases?|orders?|notice|rules?|guidelines?|power|role|position|world|society|community|prices?|shares?|stocks?|funds?|money|rupees?|dollars?|crores?|lakhs?|against|phase|stage|round|basis|terms|means|media|court|bench|judges?|petition|plea|hearing|trial|filed|verdict|judgment|accused|arrest|crime|police|forces?|security|chief|heads?|houses?|assembly|parliament|budget|elections?|polls|votes?|voters?|rally|campaign|candidates?|workers?|members?|leaders?|alliance|coalition|seats?|constituency|mandate|defence|defense|military|missiles?|weapons?|vehicles?|partners?|partnership|trade|energy|health|education|technology|finance|foreign|infrastructure|agriculture|environment|urban|rural|welfare|labour|labor|telecom|consumer|civil|rights|liberties|governance|legal|politics|policy|policies|economic|fiscal|monetary|strategic|bilateral|talks|summit|visit|treaty|accord|pact|deals?|agreements?|supplies?|supply|demand|keen|amid|over|move|plan|plans|planned|planning|eyes|aimed|focus|focused|ready|offers?|offered|offering|empire|emperor|mughal|mughals|sikh|ancient|century|historical|dynasty|kings?|queens?|prince|reign|era|ruled|ruler|kingdom|battle|fought|posts?|sales?|experts?|platforms?|women|woman|doctor|doctors|homes?|camps?|moment|moments|supreme|concerns?|issues?|affairs?|matters?|points?|approach|sector|areas?|aspects?|parts?|sides?|places?|figures?|stories?|facts?|claims?|views?|steps?|ways?|forms?|types?|rates?|levels?|signs?|links?|lines?|moves?|works?|cells?|boards?|units?|tests?|tasks?|drugs?|lands?|laws?|loans?|bids?|aids?|cuts?|gaps?|maps?|rows?|runs?|wars?|acts?)$/,
+    TIME: /^(year|years|month|months|week|weeks|day|days|today|yesterday|tomorrow|time|times|hour|hours|minute|minutes|second|seconds|morning|evening|night|monday|tuesday|wednesday|thursday|friday|saturday|sunday|january|february|march|april|may|june|july|august|september|october|november|december|annual|quarterly|daily|weekly|monthly|yearly|summer|winter|spring|season|seasonal)$/,
+    NUMBER: /^(one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve|hundred|thousand|million|billion|crore|lakh|percent|percentage|half|quarter|double|triple|single|multiple|several|many|much|fewer|little|more|most|less|least)$/,
+    FILLER: /^(also|just|only|even|still|already|never|always|often|actually|really|however|therefore|moreover|furthermore|nevertheless|meanwhile|otherwise|instead|despite|regardless|whether|hence|basically|essentially|generally|normally|typically|likely|being|about|would|could|should|where|there|which|these|those|while|since|during|through|having|doing|going|getting|gives|given|takes|taken|makes|comes|known|shown|thing|things|based|called|saying|added|noted|around|among|every|moved|asked|urged|wants|needs|looks|seeks|plans|aimed|moves|steps|bring|turned|remains|raised|calls|allow|shows|taken|india|indias|indian|indians|hindustan|bharat|modi|modis|what|will|with|from|have|been|than|into|this|that|they|them|were|does|done|such|some|both|each|back|down|then|when|very|much|here|well|updates?|watch|live|video|breaking|exclusive|opinion|editorial|analysis|explainer|explained|podcast|newsletter|subscribe|click|read|more|full|story|stories|headline|headlines|check|latest|scroll|print|online|digital|viral|courage|for|the|and|not|why|how|can|are|out|its|but|who|has|was|must|new|top|key|news|high|govt|west|secret|secrets|route|routes|merge|merged|merger|drive|drives|bid|bids|set|sets|big|ahead|amid|face|faces|row|deal|deals|push|pull|rise|rises|fell|fall|cut|cuts|hold|held|led|loss|gain|run|runs|hit|hits|clear|open|opens|close|closes|share|shares|pass|passed|post|posts|eye|eyes|part|parts|late|early|soon|near|far|long|short|fast|slow|hard|soft|wide|deep|main|major|minor|real|good|bad|best|worst|next|last|old|free|safe|clean|fresh|sharp|flat|firm|easy|tough|huge|tiny|vast|raw|rare|fine|due|aim|left|right|side|ends|start|begin|began|end|ended|issue|issues|case|cases|order|orders|line|lines|point|points|level|levels|form|forms|round|rounds|mark|marks|role|roles|test|tests|rise|phase|wave|gap|base|block|launch|lead|leads|stand|stands|found|join|joins|claim|claims|list|lists|act|acts|link|links|offer|offers|record|records|range|ranges|focus|target|targets|serve|serves|extend|extends|cover|covers|pick|picks|boost|land|lands|drop|drops|build|term|terms|code|body|head|data|use|uses|used|way|ways|help|helps|told|says|said|plan|rate|rates|seat|seats|force|forces|file|filed|files|age|aged|sign|signs|signed|own|owned|rest|core|area|areas|unit|units|work|works|meet|meets|rule|rules|team|teams|size|type|types|kind|took|keep|kept|send|sent|make|need|sees|seen|look|give|gave|take|tell|come|came|went|know|knew|gets|name|names|named|call|find|want|fact|stop|move|turn|pay|paid|cost|vote|votes|tax|put|bring|brought|seek|play|plays|win|won|lost|able|first|second|third|total|local|national|global|public|private|former|current|recent|official|officials|central|state|states|likely|report|reports|reported|according|says|said|people|country|countries|world|government|minister|ministry|court|board|company|companies|year|years|month|months|week|weeks|day|days|time|times|number|percent|crore|lakh|million|billion|under|over|after|before|between|within|against|without|above|below|across|replace|replaced|replaces|select|selected|switch|switched|offered|offering|measures|measure|eligible|easing|eased|guru|tied|shift|shifts|shifted|impact|impacts|place|places|placed|region|regions|district|districts|special|general|direct|based|added|leader|leaders|chief|entire|ensure|common|limit|limits|final|panel|policy|policies|reform|reforms|move|removed|allow|allowed|review|reviews|propose|proposed|release|released|raise|approve|approved|reject|rejected|revise|revised|expand|expanded|implement|implemented|announce|announced|suspend|suspended|restore|restored|extend|extended|withdraw|withdrawn|impose|imposed|appoint|appointed|transfer|transferred|grant|granted)$/,
+    PERSON: /^(kumar|sharma|singh|gupta|verma|agarwal|jain|patel|shah|mehta|reddy|rao|naidu|choudhary|mishra|pandey|tiwari|yadav|chauhan|rajput|thakur|nair|menon|pillai|iyer|mukherjee|banerjee|chatterjee|bhattacharya|das|bose|sen|roy|ghosh|dutta|sinha|prasad|prakash|rahul|vijay|vijays|amit|rohit|deepak|rakesh|suresh|ramesh|bahadur|gandhi|nehru|trump|biden|obama|putin|jinping|macron|narendra|dario|abhishek|shri|smt|dr|prof|justice|advocate)$/,
+    SOURCE: /^(outlook|ndtv|cnbc|reuters|firstpost|swarajya|swarajyamag|livemint|livelaw|mongabay|mercom|onmanorama|yourstory|ipleaders|moneycontrol|theprint|thewire|thequint|deccan|jagran|krishi|inc42|bloomberg|zeenews|wion|ani|businessline|mondaq|taxguru|solarquarter|indianweb|etenergyworld|etgovernment|indiatoday|indiaspend|hindustan)$/,
+    isNoise(w) {
+        return KW_NOISE.test(w);
+    },
+    extract(title) {
+        const keywords = [];
+        (title.match(/\b[A-Z]{2,6}\b/g) || []).forEach(a => {
+            if (!COMMON_CAPS.has(a)) keywords.push(a);
+        });
+        // Detect proper name sequences and exclude their parts
+        const nameWords = new Set();
+        const nameMatches = title.match(/\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,4}\b/g) || [];
+        nameMatches.forEach(name => {
+            const parts = name.toLowerCase().split(/\s+/);
+            if (parts.some(p => this.PERSON.test(p))) {
+                parts.forEach(p => nameWords.add(p));
+            }
+        });
+        const clean = title.toLowerCase().replace(/[''\u2019]s\b/g, '').replace(/[^a-z\s-]/g, '').replace(/\s+/g, ' ').trim();
+        const words = clean.split(' ').filter(w => w.length >= 3 && !nameWords.has(w));
+        // Bigrams
+        for (let i = 0; i < words.length - 1; i++) {
+            const a = words[i], b = words[i + 1];
+            if (a.length >= 4 && b.length >= 4 && !this.isNoise(a) && !this.isNoise(b)) {
+                keywords.push(a + ' ' + b);
+            }
+        }
+        // Singles (only if not in a bigram)
+        const bigrams = new Set(keywords.filter(k => k.includes(' ')).flatMap(k => k.split(' ')));
+        words.forEach(w => {
+            if (w.length >= 5 && !this.isNoise(w) && !bigrams.has(w)) keywords.push(w);
+        });
+        return [...new Set(keywords)];
+    }
+};
+
+// Shared comparator for {name/kw, count} entries — reused across the
+// trending and signal sorts instead of allocating a closure per call.
+const byCountDesc = (a, b) => b.count - a.count;
+
+// All noise classes compiled into one automaton at load: isNoise runs for
+// every candidate word of every title, and one combined regex pass beats
+// eleven separate test() calls. Each component stays ^…$-anchored, so the
+// union matches exactly the same word set.
+const KW_NOISE = new RegExp([
+    KW.PLACE, KW.PLACE_NAMES, KW.REPORT_VERB, KW.ACTION_VERB, KW.MODIFIER,
+    KW.GENERIC_NOUN, KW.TIME, KW.NUMBER, KW.FILLER, KW.PERSON, KW.SOURCE,
+].map(r => '(?:' + r.source + ')').join('|'));
+
+// Extract trending topics from articles using KW extractor
+function extractTrendingTopics(articles) {
+    const topicCount = {};
+    articles.forEach(article => {
+        const title = article.title || '';
+        KW.extract(title).forEach(kw => {
+            topicCount[kw] = (topicCount[kw] || 0) + 1;
+        });
+    });
+
+    // Plural deduplication
+    const merged = new Map();
+    Object.entries(topicCount).forEach(([kw, count]) => {
+        const norm = kw.replace(/s$/, '');
+        const existing = merged.get(norm);
+        if (existing) {
+            existing.count += count;
+            if (kw.length < existing.name.length) existing.name = kw;
+        } else {
+            merged.set(norm, { name: kw, count });
+        }
+    });
+
+    return [...merged.values()]
+        .filter(t => t.count >= 2)
+        .sort(byCountDesc)
+        .slice(0, 8);
+}
+
+// Filter by trending keyword
+function filterByKeyword(keyword) {
+    const searchInput = document.getElementById('search-input');
+    searchInput.value = keyword;
+    handleSearch(keyword);
+
+    // Scroll to articles
+    document.getElementById('main-content')?.scrollIntoView({ behavior: 'smooth' });
+}
+
+function renderBigPicture() {
+    const textEl = document.getElementById('big-picture-text');
+
+    if (state.bigPictureItems && state.bigPictureItems.length > 0) {
+        // Structured data: render as clickable bullet list
+        const items = state.bigPictureItems.map(item => {
+            const sourceLabel = item.source_count >= 3
+                ? `${item.source_count} sources`
+                : (item.source || '');
+            const badge = item.source_count >= 3
+                ? `<span class="bp-source-badge">${escapeHtml(sourceLabel)}</span>`
+                : `<span class="bp-source">${escapeHtml(sourceLabel)}</span>`;
+            const titleHtml = item.url
+                ? `<a href="${escapeHtml(item.url)}" target="_blank" rel="noopener">${escapeHtml(item.title)}</a>`
+                : escapeHtml(item.title);
+            return `<li>${titleHtml} ${badge}</li>`;
+        }).join('');
+        textEl.innerHTML = `<ul class="big-picture-list">${items}</ul>`;
+    } else if (state.bigPicture) {
+        // Backward compat: split on newlines and render as bullets
+        const lines = state.bigPicture.split('\n').filter(l => l.trim());
+        if (lines.length > 1) {
+            textEl.innerHTML = '<ul class="big-picture-list">' +
+                lines.map(l => `<li>${escapeHtml(l.replace(/^•\s*/, ''))}</li>`).join('') +
+                '</ul>';
+        } else {
+            textEl.textContent = state.bigPicture;
+        }
+    } else {
+        textEl.textContent = 'Policy summary is being generated. Check back shortly.';
+    }
+
+    // Update hero stats
+    const totalEl = document.getElementById('hero-total');
+    const criticalEl = document.getElementById('hero-critical');
+    const sourcesEl = document.getElementById('hero-sources');
+
+    if (totalEl) totalEl.textContent = state.allArticles.length || '-';
+    if (criticalEl) criticalEl.textContent = state.allArticles.filter(a => a.priority_class === 'critical').length || '0';
+    if (sourcesEl) sourcesEl.textContent = state.sourcesCited || '-';
+
+    // Update timestamp
+    const timestampEl = document.getElementById('hero-timestamp');
+    if (timestampEl && state.lastUpdated) {
+        const date = new Date(state.lastUpdated);
+        const now = new Date();
+        const diffMs = now - date;
+        const diffMins = Math.floor(diffMs / 60000);
+        const diffHours = Math.floor(diffMins / 60);
+
+        if (diffMins < 60) {
+            timestampEl.textContent = `Updated ${diffMins} min${diffMins !== 1 ? 's' : ''} ago`;
+        } else if (diffHours < 24) {
+            timestampEl.textContent = `Updated ${diffHours} hour${diffHours !== 1 ? 's' : ''} ago`;
+        } else {
+            timestampEl.textContent = `Updated ${date.toLocaleDateString()}`;
+        }
+    }
+
+    // Update trending topics
+    const trendingList = document.getElementById('hero-trending-list');
+    if (trendingList && state.trendingTopics && state.trendingTopics.length > 0) {
+        trendingList.innerHTML = state.trendingTopics.slice(0, 5).map(topic => {
+            const name = topic.name || topic.topic;
+            const count = topic.count || 0;
+            return `<a class="hero-trending-item" href="connections.html?kw=${encodeURIComponent(name)}" onclick="event.preventDefault(); filterByKeyword('${escapeHtml(name)}')" oncontextmenu="">${escapeHtml(name)} (${count})</a>`;
+        }).join('');
+    } else if (trendingList) {
+        trendingList.innerHTML = '<span style="color: #92400e; font-size: 0.75rem;">Loading trends...</span>';
+    }
+}
+
+
+function renderSignalWidget(articles) {
+    const dateCounts = {};
+    articles.forEach(a => {
+        const d = (a.publication_date || '').slice(0, 10);
+        if (d) dateCounts[d] = (dateCounts[d] || 0) + 1;
+    });
+    const dates = Object.keys(dateCounts).filter(d => dateCounts[d] > 5).sort();
+    if (dates.length < 3) return;
+
+    const validDates = new Set(dates);
+    const valid = articles.filter(a => validDates.has((a.publication_date || '').slice(0, 10)));
+
+    // Build keyword timeline
+    const kwByDate = {};
+    valid.forEach(a => {
+        const d = (a.publication_date || '').slice(0, 10);
+        KW.extract(a.title || '').forEach(kw => {
+            if (!kwByDate[kw]) kwByDate[kw] = { byDate: {}, total: 0 };
+            kwByDate[kw].byDate[d] = (kwByDate[kw].byDate[d] || 0) + 1;
+            kwByDate[kw].total++;
+        });
+    });
+
+    // Plural dedup
+    const merged = new Map();
+    Object.entries(kwByDate).forEach(([kw, info]) => {
+        const norm = kw.replace(/s$/, '');
+        const ex = merged.get(norm);
+        if (ex) {
+            ex.total += info.total;
+            Object.entries(info.byDate).forEach(([d, c]) => { ex.byDate[d] = (ex.byDate[d] || 0) + c; });
+            if (kw.length < ex.name.length) ex.name = kw;
+        } else {
+            merged.set(norm, { name: kw, ...info });
+        }
+    });
+
+    const mid = Math.floor(dates.length / 2);
+    const early = dates.slice(0, mid);
+    const recent = dates.slice(mid);
+
+    const accel = [];
+    const newSigs = [];
+    merged.forEach((info) => {
+        const earlyCount = early.reduce((s, d) => s + (info.byDate[d] || 0), 0);
+        const recentCount = recent.reduce((s, d) => s + (info.byDate[d] || 0), 0);
+        if (earlyCount === 0 && recentCount >= 2) {
+            newSigs.push({ kw: info.name, count: recentCount });
+        } else if (earlyCount > 0 && recentCount > earlyCount) {
+            const change = ((recentCount - earlyCount) / earlyCount * 100);
+            if (change >= 50 && info.total >= 3) {
+                accel.push({ kw: info.name, change, recentCount, earlyCount });
+            }
+        }
+    });
+
+    accel.sort((a, b) => b.change - a.change);
+    newSigs.sort(byCountDesc);
+
+    const chips = [];
+    // Top 5 accelerating
+    accel.slice(0, 5).forEach(s => {
+        chips.push(`<a class="signal-chip signal-chip-accel" href="connections.html?kw=${encodeURIComponent(s.kw)}" title="${s.earlyCount} → ${s.recentCount} articles · Explore on Connections">
+            ${escapeHtml(s.kw)}
+        </a>`);
+    });
+    // Top 3 new signals if space
+    newSigs.slice(0, 3).forEach(s => {
+        chips.push(`<a class="signal-chip signal-chip-new" href="connections.html?kw=${encodeURIComponent(s.kw)}" title="${s.count} articles, first seen recently · Explore on Connections">
+            ${escapeHtml(s.kw)}
+        </a>`);
+    });
+
+    if (chips.length === 0) return;
+
+    const fmt = d => new Date(d + 'T00:00:00').toLocaleDateString('en-IN', { month: 'short', day: 'numeric' });
+    const fmtDay = d => new Date(d + 'T00:00:00').getDate();
+    const fmtMon = d => new Date(d + 'T00:00:00').toLocaleDateString('en-IN', { month: 'short' });
+    function rangeLabel(a, b) {
+        if (a === b) return fmt(a);
+        return fmtMon(a) === fmtMon(b) ? `${fmtDay(a)}–${fmtDay(b)} ${fmtMon(b)}` : `${fmt(a)}–${fmt(b)}`;
+    }
+
+    document.getElementById('signal-widget-period').textContent = rangeLabel(early[0], recent[recent.length - 1]);
+    document.getElementById('signal-widget-grid').innerHTML = chips.join('');
+    // Summary line: article count + source count + fastest-growing topics
+    const totalArticles = articles.length;
+    const sourceCount = state.sourcesCited || new Set(articles.map(a => a.source_name).filter(Boolean)).size;
+    const topNames = accel.slice(0, 3).map(s => s.kw).join(', ');
+    const summaryEl = document.getElementById('signal-widget-summary');
+    if (summaryEl) {
+        summaryEl.textContent = `${totalArticles.toLocaleString('en-IN')} articles across ${sourceCount}+ sources. Fastest-growing: ${topNames}`;
+    }
+    document.getElementById('signal-widget').style.display = 'block';
+}
+
+function renderCategoryBriefingsGrid() {
+    const container = document.getElementById('category-briefings-grid');
+    const section = document.getElementById('category-briefings-section');
+    const summaries = state.categorySummaries;
+
+    const urlParams2 = new URLSearchParams(window.location.search);
+    const isFocusMode = urlParams2.has('q') || urlParams2.has('domain') || urlParams2.has('category') || urlParams2.has('sourceType');
+    if (!summaries || Object.keys(summaries).length === 0 || isFocusMode) {
+        section.style.display = 'none';
+        return;
+    }
+
+    section.style.display = 'block';
+
+    // Sort by count descending, show all
+    const sortedCategories = Object.entries(summaries)
+        .sort((a, b) => b[1].count - a[1].count);
+
+    // Preview chips in header
+    const chipsEl = document.getElementById('briefing-preview-chips');
+    if (chipsEl) {
+        chipsEl.innerHTML = sortedCategories.map(([cat]) => {
+            const c = CATEGORY_COLORS[cat] || '#6b7280';
+            return `<span style="font-size:0.625rem;font-weight:600;padding:2px 8px;border-radius:999px;background:${c};color:white;text-transform:uppercase;letter-spacing:0.03em;">${escapeHtml(cat)}</span>`;
+        }).join('');
+    }
+
+    // Update count hint
+    const countHint = document.getElementById('briefing-category-count');
+    if (countHint) countHint.textContent = `${sortedCategories.length} categories`;
+
+    container.innerHTML = sortedCategories.map(([cat, info]) => {
+        const color = CATEGORY_COLORS[cat] || '#6b7280';
+        let bulletsHtml = '';
+        if (info.top_headlines && info.top_headlines.length > 0) {
+            bulletsHtml = '<ul class="briefing-bullets">' +
+                info.top_headlines.slice(0, 3).map(h => {
+                    const href = h.url ? escapeHtml(h.url) : '#';
+                    return `<li><a href="${href}" target="_blank" rel="noopener">${escapeHtml(h.title)}</a></li>`;
+                }).join('') + '</ul>';
+        } else if (info.summary) {
+            const lines = info.summary.split('\n').filter(l => l.trim()).slice(0, 3);
+            bulletsHtml = '<ul class="briefing-bullets">' +
+                lines.map(l => `<li>${escapeHtml(l.replace(/^•\s*/, '').split(' — ')[0])}</li>`).join('') +
+                '</ul>';
+        } else {
+            bulletsHtml = `<div class="category-briefing-summary">${escapeHtml(info.top_article_title || '')}</div>`;
+        }
+
+        return `
+            <div class="category-briefing-card" style="--cat-color: ${color}">
+                <div class="category-briefing-header">
+                    <a class="category-briefing-badge" href="intelligence.html?sector=${encodeURIComponent(cat)}" style="background: ${color}; text-decoration: none; color: white;">${escapeHtml(cat)}</a>
+                    <span class="category-briefing-count">${info.count} stories</span>
+                </div>
+                ${bulletsHtml}
+            </div>
+        `;
+    }).join('');
+}
+
+function toggleBriefingSection() {
+    const grid = document.getElementById('category-briefings-grid');
+    const chevron = document.getElementById('briefing-chevron');
+    const expandText = document.getElementById('briefing-expand-text');
+    const isHidden = grid.style.display === 'none';
+    grid.style.display = isHidden ? '' : 'none';
+    if (chevron) chevron.style.transform = isHidden ? 'rotate(180deg)' : '';
+    if (expandText) expandText.textContent = isHidden ? 'Collapse' : 'Show all';
+    const chips = document.getElementById('briefing-preview-chips');
+    if (chips) chips.style.display = isHidden ? 'none' : 'flex';
+}
+
+function renderTopCategoryBar() {
+    // No longer renders category bar - domains handle filtering
+    renderTicker();
+}
+
+function setDomainFilter(domain, element) {
+    // Update domain pill states
+    document.querySelectorAll('.domain-pill').forEach(el => {
+        el.classList.remove('active');
+    });
+    element.classList.add('active');
+
+    // Store selected domain
+    state.filters.domain = domain || null;
+    state.filters.category = null;
+    state.filters.subcategory = null;
+    currentSelectedCategory = null;
+
+    // Show/hide subsector row and category summary
+    const subsectorRow = document.getElementById('subsector-row');
+    const subsectorPills = document.getElementById('subsector-pills');
+    const categorySummaryRow = document.getElementById('category-summary-row');
+
+    // Always hide summary when changing domain
+    if (categorySummaryRow) categorySummaryRow.style.display = 'none';
+
+    const activeSubs = isUpscView ? UPSC_DOMAINS : SUBCATEGORIES;
+    const activeDomains = isUpscView ? UPSC_DOMAINS : DOMAIN_CATEGORIES;
+    if (domain && activeSubs[domain]) {
+        const categories = activeSubs[domain];
+
+        // Per-category counts come precomputed from the data-load pass
+        const counts = categoryCounts;
+
+        subsectorPills.innerHTML = `
+            <button class="subsector-pill active" data-category="" onclick="selectSubcategory('', this)">
+                All
+            </button>
+            ${categories.map(cat => `
+                <button class="subsector-pill" data-category="${escapeHtml(cat)}" onclick="selectSubcategory('${escapeHtml(cat)}', this)">
+                    ${escapeHtml(cat)} <span style="opacity: 0.7">(${counts.get(cat) || 0})</span>
+                </button>
+            `).join('')}
+        `;
+        subsectorRow.style.display = 'flex';
+    } else {
+        subsectorRow.style.display = 'none';
+    }
+
+    state.currentPage = 1;
+    applyFiltersAndRender();
+
+    // Focus mode: hide overview sections when filtered, restore on "All"
+    // Runs AFTER render to ensure sections aren't re-shown
+    ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+        const el = document.getElementById(id);
+        if (el) el.style.display = domain ? 'none' : '';
+    });
+    document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = domain ? 'none' : '');
+    const mainEl = document.getElementById('main-content');
+    if (mainEl) mainEl.style.gridTemplateColumns = domain ? '1fr' : '';
+    document.querySelectorAll('.sidebar').forEach(el => el.style.display = domain ? 'none' : '');
+}
+
+function showUpscBubble() {
+    if (localStorage.getItem('upsc_bubble_dismissed')) return;
+    const bubble = document.getElementById('upsc-bubble');
+    if (bubble) bubble.style.display = 'block';
+}
+function dismissUpscBubble() {
+    localStorage.setItem('upsc_bubble_dismissed', '1');
+    const bubble = document.getElementById('upsc-bubble');
+    if (bubble) bubble.style.display = 'none';
+}
+
+function toggleUpscView() {
+    dismissUpscBubble();
+    isUpscView = !isUpscView;
+    const toggle = document.getElementById('upsc-toggle');
+    toggle.classList.toggle('active', isUpscView);
+    const mobileTab = document.getElementById('mobile-upsc-tab');
+    if (mobileTab) mobileTab.classList.toggle('active', isUpscView);
+
+    // Reset domain selection
+    state.filters.domain = null;
+    state.filters.category = null;
+    currentSelectedCategory = null;
+    document.getElementById('subsector-row').style.display = 'none';
+    const summaryRow = document.getElementById('category-summary-row');
+    if (summaryRow) summaryRow.style.display = 'none';
+
+    // Rebuild domain pills
+    const container = document.getElementById('domain-pills');
+    if (isUpscView) {
+        container.innerHTML = `
+            <button class="domain-pill active" data-domain="" onclick="setDomainFilter('', this)">All</button>
+            <button class="domain-pill" data-domain="gs2" onclick="setDomainFilter('gs2', this)">${UPSC_LABELS.gs2}</button>
+            <button class="domain-pill" data-domain="gs3" onclick="setDomainFilter('gs3', this)">${UPSC_LABELS.gs3}</button>
+        `;
+    } else {
+        container.innerHTML = `
+            <button class="domain-pill active" data-domain="" onclick="setDomainFilter('', this)">All</button>
+            <button class="domain-pill domain-economy" data-domain="economy" onclick="setDomainFilter('economy', this)">Economy</button>
+            <button class="domain-pill domain-technology" data-domain="technology" onclick="setDomainFilter('technology', this)">Technology</button>
+            <button class="domain-pill domain-infrastructure" data-domain="infrastructure" onclick="setDomainFilter('infrastructure', this)">Infrastructure</button>
+            <button class="domain-pill domain-social" data-domain="social" onclick="setDomainFilter('social', this)">Social</button>
+            <button class="domain-pill domain-governance" data-domain="governance" onclick="setDomainFilter('governance', this)">Governance</button>
+            <button class="domain-pill domain-foreign" data-domain="foreign" onclick="setDomainFilter('foreign', this)">Foreign</button>
+        `;
+    }
+
+    // Rebuild mobile domain chips to match
+    const mobileContainer = document.getElementById('mobile-domain-filters');
+    if (mobileContainer) {
+        if (isUpscView) {
+            mobileContainer.innerHTML = `
+                <button class="mobile-filter-chip active" data-domain="" onclick="setMobileDomainFilter('', this)">All</button>
+                <button class="mobile-filter-chip" data-domain="gs2" onclick="setMobileDomainFilter('gs2', this)">${UPSC_LABELS.gs2}</button>
+                <button class="mobile-filter-chip" data-domain="gs3" onclick="setMobileDomainFilter('gs3', this)">${UPSC_LABELS.gs3}</button>
+            `;
+        } else {
+            mobileContainer.innerHTML = `
+                <button class="mobile-filter-chip active" data-domain="" onclick="setMobileDomainFilter('', this)">All</button>
+                <button class="mobile-filter-chip" data-domain="economy" onclick="setMobileDomainFilter('economy', this)">Finance</button>
+                <button class="mobile-filter-chip" data-domain="technology" onclick="setMobileDomainFilter('technology', this)">Digital</button>
+                <button class="mobile-filter-chip" data-domain="infrastructure" onclick="setMobileDomainFilter('infrastructure', this)">Infrastructure</button>
+                <button class="mobile-filter-chip" data-domain="social" onclick="setMobileDomainFilter('social', this)">Social</button>
+                <button class="mobile-filter-chip" data-domain="governance" onclick="setMobileDomainFilter('governance', this)">Governance</button>
+                <button class="mobile-filter-chip" data-domain="foreign" onclick="setMobileDomainFilter('foreign', this)">Foreign</button>
+            `;
+        }
+    }
+
+    state.currentPage = 1;
+    applyFiltersAndRender();
+
+    // Hide/show Top Stories for UPSC focus
+    const featuredEl = document.getElementById('featured-stories');
+    if (featuredEl) featuredEl.style.display = isUpscView ? 'none' : '';
+}
+
+function selectSubcategory(category, element) {
+    // Update subsector pill states
+    document.querySelectorAll('.subsector-pill').forEach(el => {
+        el.classList.remove('active');
+    });
+    element.classList.add('active');
+
+    const summaryRow = document.getElementById('category-summary-row');
+    const summaryContent = document.getElementById('category-summary-content');
+
+    if (!category || !state.filters.domain) {
+        // "All" selected
+        state.filters.subcategory = null;
+        currentSelectedCategory = null;
+        summaryRow.style.display = 'none';
+    } else {
+        // Filter by specific category
+        state.filters.subcategory = category;
+        currentSelectedCategory = category;
+
+        // Show category summary (only when no source type filter, since summaries are pre-generated)
+        const catSummary = state.categorySummaries[category];
+        if (catSummary && (catSummary.top_headlines || catSummary.summary) && !state.filters.sourceType) {
+            // Prefer structured top_headlines if available (extractive format)
+            let bodyHtml = '';
+            if (catSummary.top_headlines && catSummary.top_headlines.length > 0) {
+                const items = catSummary.top_headlines.map(h => {
+                    const titleHtml = h.url
+                        ? `<a href="${escapeHtml(h.url)}" target="_blank" rel="noopener">${escapeHtml(h.title)}</a>`
+                        : escapeHtml(h.title);
+                    const sourceHtml = h.source
+                        ? `<span class="bp-source">${escapeHtml(h.source)}</span>`
+                        : '';
+                    return `<li>${titleHtml} ${sourceHtml}</li>`;
+                }).join('');
+                bodyHtml = `<ul class="big-picture-list">${items}</ul>`;
+            } else {
+                // Backward compat: split string on newlines
+                const lines = (catSummary.summary || '').split('\n').filter(l => l.trim());
+                if (lines.length > 1) {
+                    bodyHtml = '<ul class="big-picture-list">' +
+                        lines.map(l => `<li>${escapeHtml(l.replace(/^•\s*/, ''))}</li>`).join('') +
+                        '</ul>';
+                } else {
+                    bodyHtml = `<span class="category-summary-text">${escapeHtml(catSummary.summary)}</span>`;
+                }
+            }
+            summaryContent.innerHTML = `
+                <span class="category-summary-badge">
+                    ${escapeHtml(category)}
+                    <span style="opacity: 0.8">${catSummary.count} stories</span>
+                </span>
+                ${bodyHtml}
+            `;
+            summaryRow.style.display = 'block';
+        } else {
+            summaryRow.style.display = 'none';
+        }
+    }
+
+    state.currentPage = 1;
+    applyFiltersAndRender();
+}
+
+// Legacy function for backwards compatibility
+function filterByCategory(element) {
+    const category = element?.dataset?.category || '';
+    state.filters.category = category || null;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+}
+
+// Top Stories Ticker - Disabled (content moved to Big Picture)
+function renderTicker() {
+    // Ticker removed - breaking news now in Big Picture
+    return;
+}
+
+function renderFeaturedStories() {
+    const container = document.getElementById('featured-stories-scroll');
+    const section = document.getElementById('featured-stories');
+    const clusters = state.storyClusters;
+
+    const urlParams = new URLSearchParams(window.location.search);
+    const isFocusMode = urlParams.has('q') || urlParams.has('domain') || urlParams.has('category') || urlParams.has('sourceType');
+    if (!clusters || clusters.length === 0 || isFocusMode || isUpscView) {
+        section.style.display = 'none';
+        return;
+    }
+
+    section.style.display = 'block';
+
+    // Take top 4 story clusters for featured section
+    const featured = clusters.slice(0, 4);
+
+    container.innerHTML = featured.map((cluster, index) => {
+        const headline = cluster.headline || 'Untitled Story';
+        const summary = cluster.summary || '';
+        const sourceCount = cluster.source_count || cluster.perspectives?.length || 0;
+        const perspectives = cluster.perspectives || [];
+
+        // Get unique source names for preview
+        const sources = [...new Set(perspectives.map(p => p.source).filter(Boolean))].slice(0, 4);
+
+        // Build perspectives HTML for expandable section
+        const perspectivesHtml = perspectives.slice(0, 5).map(p => `
+            <div class="featured-story-perspective">
+                <div class="featured-story-perspective-source">${escapeHtml(p.source || 'Unknown')}</div>
+                <a href="${escapeHtml(p.url || '#')}" target="_blank" rel="noopener" class="featured-story-perspective-title" onclick="event.stopPropagation()">
+                    ${escapeHtml(p.title || 'Untitled')}
+                </a>
+            </div>
+        `).join('');
+
+        return `
+            <div class="featured-story-card" data-index="${index}" onclick="toggleFeaturedStory(${index})">
+                <div class="featured-story-badge">
+                    <span>📰</span>
+                    <span>${sourceCount} sources</span>
+                </div>
+                <div class="featured-story-headline">${escapeHtml(headline)}</div>
+                ${summary && summary !== headline ? `<div class="featured-story-summary">${escapeHtml(summary)}</div>` : ''}
+                <div class="featured-story-sources">
+                    ${sources.map(s => `<span class="featured-story-source">${escapeHtml(s)}</span>`).join('')}
+                </div>
+                <div class="featured-story-toggle">
+                    <span>View all sources</span>
+                    <span class="featured-story-toggle-icon">▼</span>
+                </div>
+                <div class="featured-story-perspectives">
+                    ${perspectivesHtml}
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+function toggleFeaturedStory(index) {
+    const card = document.querySelector(`.featured-story-card[data-index="${index}"]`);
+    if (card) {
+        // Close other expanded cards
+        document.querySelectorAll('.featured-story-card.expanded').forEach(c => {
+            if (c !== card) c.classList.remove('expanded');
+        });
+        // Toggle this card
+        card.classList.toggle('expanded');
+    }
+}
+
+function renderStoryClusters() {
+    const container = document.getElementById('story-clusters-list');
+    const clusters = state.storyClusters;
+
+    if (!clusters || clusters.length === 0) {
+        container.innerHTML = '<p style="color: var(--text-muted); font-size: 0.8125rem;">No multi-source stories detected today</p>';
+        return;
+    }
+
+    container.innerHTML = clusters.map((cluster, index) => {
+        const headline = cluster.headline || 'Untitled Story';
+        const summary = cluster.summary || '';
+        const sourceCount = cluster.source_count || cluster.perspectives?.length || 0;
+        const entities = (cluster.key_entities || []).slice(0, 3);
+        const perspectives = cluster.perspectives || [];
+
+        const entitiesHtml = entities.length > 0
+            ? `<div class="story-cluster-entities">${entities.map(e => `<span>${escapeHtml(e)}</span>`).join('')}</div>`
+            : '';
+
+        // Show synthesized summary if different from headline
+        const summaryHtml = (summary && summary !== headline)
+            ? `<div class="story-cluster-summary">${escapeHtml(summary)}</div>`
+            : '';
+
+        const perspectivesHtml = perspectives.slice(0, 5).map(p => `
+            <div class="perspective-item">
+                <div class="perspective-source">${escapeHtml(p.source || 'Unknown')}</div>
+                <a href="${escapeHtml(p.url || '#')}" target="_blank" rel="noopener" class="perspective-title">
+                    ${escapeHtml(p.title || 'Untitled')}
+                </a>
+                ${p.unique_angle ? `<div class="perspective-unique">💡 ${escapeHtml(p.unique_angle)}</div>` : ''}
+            </div>
+        `).join('');
+
+        return `
+            <div class="story-cluster" data-index="${index}">
+                <div class="story-cluster-header" onclick="toggleStoryCluster(${index})">
+                    <div class="story-cluster-headline">${escapeHtml(headline)}</div>
+                    ${summaryHtml}
+                    <div class="story-cluster-meta">
+                        <span class="story-cluster-badge">${sourceCount} sources</span>
+                        ${entitiesHtml}
+                        <span class="story-cluster-expand">▼</span>
+                    </div>
+                </div>
+                <div class="story-cluster-perspectives">
+                    <div style="font-size: 0.75rem; color: var(--text-muted); margin-bottom: 0.75rem;">
+                        Coverage from different sources:
+                    </div>
+                    ${perspectivesHtml}
+                </div>
+            </div>
+        `;
+    }).join('');
+}
+
+function toggleStoryCluster(index) {
+    const cluster = document.querySelector(`.story-cluster[data-index="${index}"]`);
+    if (cluster) {
+        cluster.classList.toggle('expanded');
+    }
+}
+
+function updateStats() {
+    const articles = state.allArticles;
+    const critical = articles.filter(a => a.priority_class === 'critical').length;
+    const high = articles.filter(a => a.priority_class === 'high').length;
+    const sourcesCited = new Set(articles.map(a => a.source_name)).size;
+
+    document.getElementById('stat-total').textContent = articles.length.toLocaleString();
+    document.getElementById('stat-critical').textContent = critical.toLocaleString();
+    document.getElementById('stat-high').textContent = high.toLocaleString();
+    document.getElementById('stat-sources-cited').textContent = sourcesCited.toLocaleString();
+    const sourcesMonitored = state.sourcesInspected || sourcesCited;
+    document.getElementById('stat-sources-monitored').textContent = sourcesMonitored.toLocaleString();
+
+    // Calculate trend (compare with yesterday)
+    updateStatsTrend(articles.length);
+
+    // Render category distribution
+    renderCategoryDistribution(articles);
+}
+
+function renderCategoryDistribution(articles) {
+    const barEl = document.getElementById('category-bar');
+    const legendEl = document.getElementById('category-legend');
+
+    if (!barEl || !legendEl) return;
+
+    // Count articles by category
+    const catCounts = {};
+    articles.forEach(a => {
+        const cat = a.category || 'Governance';
+        catCounts[cat] = (catCounts[cat] || 0) + 1;
+    });
+
+    // Sort by count and take top 6
+    const sorted = Object.entries(catCounts)
+        .sort((a, b) => b[1] - a[1])
+        .slice(0, 6);
+
+    const total = articles.length;
+
+    // Render bar segments
+    barEl.innerHTML = sorted.map(([cat, count]) => {
+        const pct = (count / total * 100).toFixed(1);
+        const color = CATEGORY_COLORS[cat] || '#6b7280';
+        return `<div class="category-bar-segment" style="width: ${pct}%; background: ${color};" title="${cat}: ${count} (${pct}%)"></div>`;
+    }).join('');
+
+    // Render legend
+    legendEl.innerHTML = sorted.map(([cat, count]) => {
+        const color = CATEGORY_COLORS[cat] || '#6b7280';
+        return `
+            <span class="category-legend-item" onclick="filterByCategoryFromStats('${escapeHtml(cat)}')">
+                <span class="category-legend-dot" style="background: ${color}"></span>
+                ${escapeHtml(cat)} (${count})
+            </span>
+        `;
+    }).join('');
+}
+
+function filterByCategoryFromStats(category) {
+    state.filters.category = category;
+    state.currentPage = 1;
+    applyFiltersAndRender();
+    document.getElementById('main-content')?.scrollIntoView({ behavior: 'smooth' });
+}
+
+function updateStatsFromData(stats) {
+    document.getElementById('stat-total').textContent = (stats.total || 0).toLocaleString();
+    document.getElementById('stat-critical').textContent = (stats.critical || 0).toLocaleString();
+    document.getElementById('stat-high').textContent = (stats.high || 0).toLocaleString();
+    const sourcesCited = stats.sources_cited || stats.sources || 0;
+    const sourcesInspected = stats.sources_inspected || sourcesCited;
+    document.getElementById('stat-sources-cited').textContent = sourcesCited.toLocaleString();
+    document.getElementById('stat-sources-monitored').textContent = sourcesInspected.toLocaleString();
+    state.sourcesInspected = sourcesInspected;
+}
+
+function updateStatsTrend(currentTotal) {
+    const stored = JSON.parse(localStorage.getItem('policyradar_stats') || '{}');
+    const today = new Date().toISOString().split('T')[0];
+    const yesterday = new Date(Date.now() - 86400000).toISOString().split('T')[0];
+
+    const yesterdayTotal = stored[yesterday]?.total || currentTotal;
+    const diff = ((currentTotal - yesterdayTotal) / yesterdayTotal * 100).toFixed(0);
+
+    const trendEl = document.getElementById('stat-total-trend');
+    if (trendEl) {
+        if (diff > 0) {
+            trendEl.className = 'stat-trend up';
+            trendEl.textContent = `↑ ${diff}% vs yesterday`;
+        } else if (diff < 0) {
+            trendEl.className = 'stat-trend down';
+            trendEl.textContent = `↓ ${Math.abs(diff)}% vs yesterday`;
+        } else {
+            trendEl.textContent = '';
+        }
+    }
+
+    // Store today's stats
+    stored[today] = { total: currentTotal };
+    localStorage.setItem('policyradar_stats', JSON.stringify(stored));
+}
+
+function updateLastUpdated(timestamp) {
+    if (!timestamp) return;
+    const date = new Date(timestamp);
+    const now = new Date();
+    const diffMs = now - date;
+    const diffHours = Math.floor(diffMs / (1000 * 60 * 60));
+    const diffMins = Math.floor(diffMs / (1000 * 60));
+
+    let text;
+    if (diffMins < 60) {
+        text = `Updated ${diffMins}m ago`;
+    } else if (diffHours < 24) {
+        text = `Updated ${diffHours}h ago`;
+    } else {
+        text = `Updated ${date.toLocaleDateString('en-IN', { month: 'short', day: 'numeric' })}`;
+    }
+
+    document.getElementById('last-updated').textContent = text;
+}
+
+// ========================================
+// SCROLL TO TOP
+// ========================================
+function scrollToTop() {
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+
+function markSubscribed() {
+    localStorage.setItem('policyradar_subscribed', '1');
+}
+
+function hideNewsletterCTAs() {
+    if (localStorage.getItem('policyradar_subscribed') !== '1') return;
+    const filterCta = document.querySelector('.filter-newsletter-cta');
+    if (filterCta) filterCta.style.display = 'none';
+    const banner = document.querySelector('.newsletter-banner');
+    if (banner) banner.style.display = 'none';
+}
+hideNewsletterCTAs();
+
+// Show/hide scroll-to-top button based on scroll position
+(function initScrollTopButton() {
+    const btn = document.getElementById('scroll-top-btn');
+    if (!btn) return;
+
+    let ticking = false;
+    window.addEventListener('scroll', () => {
+        if (!ticking) {
+            window.requestAnimationFrame(() => {
+                if (window.scrollY > 500) {
+                    btn.classList.add('visible');
+                } else {
+                    btn.classList.remove('visible');
+                }
+                ticking = false;
+            });
+            ticking = true;
+        }
+    });
+})();
+
+// ========================================
+// KEYBOARD SHORTCUTS
+// ========================================
+function setupKeyboardShortcuts() {
+    document.addEventListener('keydown', handleKeydown);
+}
+
+function handleKeydown(e) {
+    // Don't trigger when typing in input
+    if (['INPUT', 'TEXTAREA', 'SELECT'].includes(e.target.tagName)) {
+        if (e.key === 'Escape') {
+            e.target.blur();
+        }
+        return;
+    }
+
+    switch (e.key) {
+        case '/':
+            e.preventDefault();
+            document.getElementById('search-input').focus();
+            break;
+        case 'j':
+            e.preventDefault();
+            navigateArticles(1);
+            break;
+        case 'k':
+            e.preventDefault();
+            navigateArticles(-1);
+            break;
+        case 'o':
+        case 'Enter':
+            if (state.focusedArticleIndex >= 0) {
+                e.preventDefault();
+                openFocusedArticle();
+            }
+            break;
+        case 't':
+            e.preventDefault();
+            const todayBtn = document.querySelector('.filter-btn[data-time="today"]');
+            if (todayBtn) setTimeFilter('today', todayBtn);
+            break;
+        case 'h':
+            e.preventDefault();
+            const highBtn = document.querySelector('.filter-btn[data-priority="high"]');
+            if (highBtn) setPriorityFilter('high', highBtn);
+            break;
+        case 'p':
+            e.preventDefault();
+            showPdfModal();
+            break;
+        case 'r':
+            e.preventDefault();
+            showReadingListModal();
+            break;
+        case 'n':
+            e.preventDefault();
+            showNewsletterExportModal();
+            break;
+        case '?':
+            e.preventDefault();
+            showShortcutsHelp();
+            break;
+        case 'Escape':
+            e.preventDefault();
+            if (document.querySelector('.modal-overlay.visible')) {
+                closeAllModals();
+            } else {
+                resetFilters();
+            }
+            break;
+    }
+}
+
+function navigateArticles(direction) {
+    const articles = document.querySelectorAll('.article-card');
+    if (articles.length === 0) return;
+
+    // Remove current focus
+    articles.forEach(a => a.classList.remove('keyboard-focus'));
+
+    // Calculate new index
+    state.focusedArticleIndex = Math.max(0, Math.min(
+        articles.length - 1,
+        state.focusedArticleIndex + direction
+    ));
+
+    // Apply focus
+    const article = articles[state.focusedArticleIndex];
+    article.classList.add('keyboard-focus');
+    article.scrollIntoView({ behavior: 'smooth', block: 'center' });
+    article.focus();
+
+    announce(`Article ${state.focusedArticleIndex + 1} of ${articles.length}`);
+}
+
+function openFocusedArticle() {
+    const article = document.querySelector('.article-card.keyboard-focus');
+    if (article) {
+        const link = article.querySelector('.article-title a');
+        if (link) window.open(link.href, '_blank');
+    }
+}
+
+// ========================================
+// MODALS
+// ========================================
+function showPdfModal() {
+    document.getElementById('pdf-article-count').textContent = state.filteredArticles.length;
+    document.getElementById('pdf-modal').classList.add('visible');
+    document.getElementById('pdf-modal').querySelector('.modal-close').focus();
+}
+
+function closePdfModal() {
+    document.getElementById('pdf-modal').classList.remove('visible');
+}
+
+function showShortcutsHelp() {
+    document.getElementById('shortcuts-modal').classList.add('visible');
+    document.getElementById('shortcuts-modal').querySelector('.modal-close').focus();
+}
+
+function closeShortcutsModal() {
+    document.getElementById('shortcuts-modal').classList.remove('visible');
+}
+
+function closeAllModals() {
+    document.querySelectorAll('.modal-overlay').forEach(m => m.classList.remove('visible'));
+}
+
+// ========================================
+// READING LIST MODAL
+// ========================================
+function showReadingListModal() {
+    // Remove existing modal if present
+    document.getElementById('reading-list-modal')?.remove();
+
+    const items = Array.from(readingList.entries());
+
+    const modal = document.createElement('div');
+    modal.id = 'reading-list-modal';
+    modal.className = 'modal-overlay';
+    modal.innerHTML = `
+        <div class="modal-content" role="dialog" aria-modal="true" aria-labelledby="reading-list-title">
+            <div class="modal-header">
+                <h3 class="modal-title" id="reading-list-title">Reading List (${items.length})</h3>
+                <button class="modal-close" onclick="document.getElementById('reading-list-modal').remove()" aria-label="Close">&times;</button>
+            </div>
+            <div class="modal-body">
+                ${items.length === 0 ? `
+                    <p style="color: var(--text-muted); text-align: center; padding: 2rem 0;">
+                        Your reading list is empty.<br>
+                        Click 📑 on any article to save it for later.
+                    </p>
+                ` : `
+                    <div style="display: flex; flex-direction: column; gap: 0.75rem; max-height: 400px; overflow-y: auto;">
+                        ${items.map(([url, data]) => `
+                            <div style="display: flex; gap: 0.75rem; padding: 0.75rem; background: var(--bg-secondary); border-radius: 8px;">
+                                <div style="flex: 1; min-width: 0;">
+                                    <a href="${escapeHtml(url)}" target="_blank" rel="noopener" 
+                                       style="font-weight: 500; color: var(--text-primary); text-decoration: none; display: block; margin-bottom: 0.25rem;">
+                                        ${escapeHtml(data.title || 'Untitled')}
+                                    </a>
+                                    <div style="font-size: 0.75rem; color: var(--text-muted);">
+                                        ${escapeHtml(data.source || '')} • Saved ${formatDate(data.savedAt)}
+                                    </div>
+                                </div>
+                                <button onclick="removeFromReadingList('${escapeJsAttr(url)}')"
+                                        style="background: none; border: none; cursor: pointer; color: var(--text-muted); padding: 0.25rem;"
+                                        title="Remove from reading list">
+                                    ✕
+                                </button>
+                            </div>
+                        `).join('')}
+                    </div>
+                    <div style="margin-top: 1rem; display: flex; gap: 0.5rem;">
+                        <button class="btn btn-secondary" onclick="clearReadingList()">Clear All</button>
+                    </div>
+                `}
+            </div>
+        </div>
+    `;
+
+    modal.addEventListener('click', (e) => {
+        if (e.target === modal) modal.remove();
+    });
+
+    document.body.appendChild(modal);
+    modal.classList.add('visible');
+}
+
+function removeFromReadingList(url) {
+    readingList.delete(url);
+    saveReadingList();
+    updateBookmarkButtons();
+    showReadingListModal(); // Refresh modal
+}
+
+function clearReadingList() {
+    if (confirm('Clear all items from your reading list?')) {
+        readingList.clear();
+        saveReadingList();
+        updateBookmarkButtons();
+        showReadingListModal(); // Refresh modal
+        showToast('Reading list cleared');
+    }
+}
+
+// ========================================
+// NEWSLETTER EXPORT MODAL
+// ========================================
+function showNewsletterExportModal() {
+    // Remove existing modal if present
+    document.getElementById('newsletter-modal')?.remove();
+
+    const articles = state.filteredArticles.slice(0, 25);
+
+    const modal = document.createElement('div');
+    modal.id = 'newsletter-modal';
+    modal.className = 'modal-overlay';
+    modal.innerHTML = `
+        <div class="modal-content" role="dialog" aria-modal="true" aria-labelledby="newsletter-title" style="max-width: 700px;">
+            <div class="modal-header">
+                <h3 class="modal-title" id="newsletter-title">Export for Newsletter</h3>
+                <button class="modal-close" onclick="document.getElementById('newsletter-modal').remove()" aria-label="Close">&times;</button>
+            </div>
+            <div class="modal-body">
+                <p style="color: var(--text-muted); margin-bottom: 1rem;">
+                    Export the top ${articles.length} articles for use with Claude or other AI tools to generate your newsletter.
+                </p>
+
+                <div style="margin-bottom: 1rem;">
+                    <label style="display: flex; align-items: center; gap: 0.5rem; cursor: pointer;">
+                        <input type="radio" name="export-format" value="markdown" checked>
+                        <span>Markdown (recommended for Claude)</span>
+                    </label>
+                    <label style="display: flex; align-items: center; gap: 0.5rem; cursor: pointer; margin-top: 0.5rem;">
+                        <input type="radio" name="export-format" value="plain">
+                        <span>Plain Text</span>
+                    </label>
+                    <label style="display: flex; align-items: center; gap: 0.5rem; cursor: pointer; margin-top: 0.5rem;">
+                        <input type="radio" name="export-format" value="json">
+                        <span>JSON (for programmatic use)</span>
+                    </label>
+                </div>
+
+                <div style="display: flex; gap: 0.5rem; margin-bottom: 1rem;">
+                    <button class="btn btn-primary" onclick="copyNewsletterExport()">
+                        Copy to Clipboard
+                    </button>
+                    <button class="btn btn-secondary" onclick="downloadNewsletterExport()">
+                        💾 Download File
+                    </button>
+                </div>
+
+                <details>
+                    <summary style="cursor: pointer; color: var(--accent-primary);">Preview export</summary>
+                    <pre id="newsletter-preview" style="
+                        margin-top: 0.5rem;
+                        padding: 1rem;
+                        background: var(--bg-secondary);
+                        border-radius: 8px;
+                        font-size: 0.75rem;
+                        overflow: auto;
+                        max-height: 300px;
+                        white-space: pre-wrap;
+                    ">${escapeHtml(generateNewsletterExport('markdown'))}</pre>
+                </details>
+            </div>
+        </div>
+    `;
+
+    // Update preview on format change
+    modal.querySelectorAll('input[name="export-format"]').forEach(input => {
+        input.addEventListener('change', () => {
+            const preview = modal.querySelector('#newsletter-preview');
+            if (preview) {
+                preview.textContent = generateNewsletterExport(input.value);
+            }
+        });
+    });
+
+    modal.addEventListener('click', (e) => {
+        if (e.target === modal) modal.remove();
+    });
+
+    document.body.appendChild(modal);
+    modal.classList.add('visible');
+}
+
+function generateNewsletterExport(format = 'markdown') {
+    const articles = state.filteredArticles.slice(0, 25);
+    const today = new Date().toLocaleDateString('en-IN', { 
+        weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' 
+    });
+
+    if (format === 'json') {
+        return JSON.stringify({
+            generated: new Date().toISOString(),
+            count: articles.length,
+            articles: articles.map(a => ({
+                title: a.title,
+                source: a.source_name,
+                url: a.url,
+                date: a.publication_date,
+                category: a.category,
+                summary: a.summary,
+                priority: a.priority_class
+            }))
+        }, null, 2);
+    }
+
+    if (format === 'plain') {
+        const lines = [`PolicyRadar Daily Briefing\n${today}\n${articles.length} articles\n`];
+        articles.forEach((a, i) => {
+            lines.push(`${i + 1}. ${a.title}`);
+            lines.push(`   Source: ${a.source_name} | ${a.category}`);
+            lines.push(`   ${a.url}`);
+            if (a.summary) lines.push(`   ${a.summary.substring(0, 150)}...`);
+            lines.push('');
+        });
+        return lines.join('\n') + '\n';
+    }
+
+    // Markdown format — assembled as parts and joined once instead of
+    // repeated string concatenation per article
+    const md = [`# PolicyRadar Daily Briefing\n\n**${today}** | ${articles.length} articles\n\n---\n`];
+
+    // Group by category
+    const byCategory = {};
+    articles.forEach(a => {
+        const cat = a.category || 'Governance';
+        if (!byCategory[cat]) byCategory[cat] = [];
+        byCategory[cat].push(a);
+    });
+
+    for (const [category, catArticles] of Object.entries(byCategory)) {
+        md.push(`## ${category}\n`);
+        catArticles.forEach(a => {
+            const priority = a.priority_class === 'critical' ? '🔴 ' : a.priority_class === 'high' ? '🟠 ' : '';
+            md.push(`### ${priority}${a.title}\n`);
+            md.push(`**${a.source_name}** | ${formatDate(a.publication_date)}\n`);
+            if (a.summary) md.push(`${a.summary}\n`);
+            md.push(`[Read more](${a.url})\n\n---\n`);
+        });
+    }
+
+    return md.join('\n') + '\n';
+}
+
+function getSelectedExportFormat() {
+    return document.querySelector('input[name="export-format"]:checked')?.value || 'markdown';
+}
+
+function copyNewsletterExport() {
+    const format = getSelectedExportFormat();
+    const content = generateNewsletterExport(format);
+    navigator.clipboard.writeText(content).then(() => {
+        showToast('Copied to clipboard!');
+    }).catch(() => {
+        showToast('Failed to copy');
+    });
+}
+
+function downloadNewsletterExport() {
+    const format = getSelectedExportFormat();
+    const content = generateNewsletterExport(format);
+    const ext = format === 'json' ? 'json' : format === 'plain' ? 'txt' : 'md';
+    const blob = new Blob([content], { type: 'text/plain' });
+    const url = URL.createObjectURL(blob);
+    const a = document.createElement('a');
+    a.href = url;
+    a.download = `policyradar-briefing-${new Date().toISOString().split('T')[0]}.${ext}`;
+    a.click();
+    URL.revokeObjectURL(url);
+    showToast('Download started!');
+}
+
+// Close modals on backdrop click
+document.querySelectorAll('.modal-overlay').forEach(modal => {
+    modal.addEventListener('click', (e) => {
+        if (e.target === modal) {
+            modal.classList.remove('visible');
+        }
+    });
+});
+
+// ========================================
+// PDF EXPORT
+// ========================================
+// jsPDF is only needed for the export path, so it is fetched from the CDN
+// on first use instead of on every page view.
+let jspdfLoader = null;
+function loadJsPdf() {
+    if (window.jspdf) return Promise.resolve();
+    if (!jspdfLoader) {
+        jspdfLoader = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = 'https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js';
+            script.onload = resolve;
+            script.onerror = () => { jspdfLoader = null; reject(new Error('Failed to load jsPDF')); };
+            document.head.appendChild(script);
+        });
+    }
+    return jspdfLoader;
+}
+
+async function downloadPdf() {
+    try {
+        await loadJsPdf();
+    } catch (e) {
+        showToast('PDF export unavailable — check your connection');
+        return;
+    }
+    const { jsPDF } = window.jspdf;
+    const doc = new jsPDF();
+    const articles = state.filteredArticles;
+    const today = new Date().toLocaleDateString('en-IN', { 
+        weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' 
+    });
+
+    // Title
+    doc.setFontSize(20);
+    doc.setTextColor(37, 99, 235);
+    doc.text('PolicyRadar Daily Briefing', 105, 20, { align: 'center' });
+
+    doc.setFontSize(10);
+    doc.setTextColor(100);
+    doc.text(`${today} | ${articles.length} articles`, 105, 28, { align: 'center' });
+
+    let y = 40;
+    const margin = 15;
+    const pageWidth = 180;
+    const pageHeight = 275;
+
+    // Group by category
+    const byCategory = {};
+    articles.forEach(a => {
+        const cat = a.category || 'Governance';
+        if (!byCategory[cat]) byCategory[cat] = [];
+        byCategory[cat].push(a);
+    });
+
+    for (const [category, catArticles] of Object.entries(byCategory)) {
+        if (y > pageHeight - 60) {
+            doc.addPage();
+            y = 25;
+        }
+
+        // Category header
+        doc.setFontSize(12);
+        doc.setFont(undefined, 'bold');
+        doc.setTextColor(37, 99, 235);
+        doc.text(category, margin, y);
+        doc.setFont(undefined, 'normal');
+        y += 8;
+
+        for (const article of catArticles.slice(0, 30)) {
+            if (y > pageHeight - 35) {
+                doc.addPage();
+                y = 25;
+            }
+
+            // Priority indicator
+            doc.setFontSize(9);
+            if (article.priority_class === 'critical') {
+                doc.setTextColor(220, 53, 69);
+                doc.text('[!!]', margin, y);
+            } else if (article.priority_class === 'high') {
+                doc.setTextColor(245, 158, 11);
+                doc.text('[!]', margin, y);
+            } else {
+                doc.setTextColor(100);
+                doc.text('[-]', margin, y);
+            }
+
+            // Title
+            doc.setTextColor(30);
+            const titleLines = doc.splitTextToSize(article.title, pageWidth - 15);
+            doc.text(titleLines, margin + 12, y);
+            y += titleLines.length * 4.5;
+
+            // Source and date
+            doc.setFontSize(8);
+            doc.setTextColor(100);
+            doc.text(`${article.source_name} | ${formatDate(article.publication_date)}`, margin + 12, y);
+            y += 4;
+
+            // URL
+            doc.setTextColor(37, 99, 235);
+            doc.setFontSize(7);
+            const url = article.url;
+            const maxUrlWidth = pageWidth - 15;
+
+            if (doc.getTextWidth(url) > maxUrlWidth) {
+                const urlLines = doc.splitTextToSize(url, maxUrlWidth);
+                doc.text(urlLines[0], margin + 12, y);
+                doc.link(margin + 12, y - 2.5, doc.getTextWidth(urlLines[0]), 3, { url });
+                y += 3;
+            } else {
+                doc.text(url, margin + 12, y);
+                doc.link(margin + 12, y - 2.5, doc.getTextWidth(url), 3, { url });
+                y += 3;
+            }
+
+            y += 4;
+        }
+
+        y += 6;
+    }
+
+    // Footer on all pages
+    const pageCount = doc.internal.getNumberOfPages();
+    for (let i = 1; i <= pageCount; i++) {
+        doc.setPage(i);
+
+        // Watermark
+        doc.setFontSize(50);
+        doc.setTextColor(240, 240, 240);
+        doc.text('policyradar.in', 105, 150, { align: 'center', angle: 45 });
+
+        // Footer
+        doc.setFontSize(8);
+        doc.setTextColor(150);
+        doc.text(`PolicyRadar | policyradar.in | Page ${i} of ${pageCount}`, 105, 290, { align: 'center' });
+    }
+
+    doc.save(`PolicyRadar_${new Date().toISOString().split('T')[0]}.pdf`);
+    closePdfModal();
+    showToast('PDF downloaded successfully!');
+}
+
+// ========================================
+// SHARING
+// ========================================
+async function shareArticle(event, url, title) {
+    event.stopPropagation();
+
+    const shareData = {
+        title: title,
+        text: `${title} via PolicyRadar`,
+        url: url,
+    };
+
+    if (navigator.share) {
+        try {
+            await navigator.share(shareData);
+        } catch (err) {
+            if (err.name !== 'AbortError') {
+                copyToClipboard(url);
+            }
+        }
+    } else {
+        copyToClipboard(url);
+    }
+}
+
+function copyToClipboard(text) {
+    navigator.clipboard.writeText(text).then(() => {
+        showToast('Link copied to clipboard!');
+    }).catch(() => {
+        showToast('Failed to copy link');
+    });
+}
+
+// ========================================
+// READING LIST
+// ========================================
+const readingList = new Map();
+
+function initReadingList() {
+    try {
+        const stored = localStorage.getItem('policyradar_reading_list');
+        if (stored) {
+            const parsed = JSON.parse(stored);
+            Object.entries(parsed).forEach(([url, data]) => {
+                readingList.set(url, data);
+            });
+        }
+    } catch (e) {
+        console.warn('Failed to load reading list:', e);
+    }
+    updateBookmarkButtons();
+}
+
+function saveReadingList() {
+    try {
+        const obj = Object.fromEntries(readingList);
+        localStorage.setItem('policyradar_reading_list', JSON.stringify(obj));
+    } catch (e) {
+        console.warn('Failed to save reading list:', e);
+    }
+}
+
+function toggleReadingList(event, url, title, source) {
+    event.stopPropagation();
+
+    if (readingList.has(url)) {
+        readingList.delete(url);
+        showToast('Removed from reading list');
+    } else {
+        readingList.set(url, {
+            title: title,
+            source: source,
+            savedAt: new Date().toISOString()
+        });
+        showToast('Added to reading list');
+    }
+
+    saveReadingList();
+    updateBookmarkButtons();
+}
+
+function updateBookmarkButtons() {
+    document.querySelectorAll('.bookmark-btn').forEach(btn => {
+        const url = btn.dataset.url;
+        if (readingList.has(url)) {
+            btn.textContent = '🔖';
+            btn.title = 'Remove from reading list';
+            btn.classList.add('bookmarked');
+        } else {
+            btn.textContent = '📑';
+            btn.title = 'Save to reading list';
+            btn.classList.remove('bookmarked');
+        }
+    });
+}
+
+// ========================================
+// THEME
+// ========================================
+function initTheme() {
+    // Check both possible localStorage keys for cross-page sync
+    const saved = localStorage.getItem('theme') || localStorage.getItem('policyradar-theme');
+
+    if (saved === 'dark') {
+        document.documentElement.setAttribute('data-theme', 'dark');
+    } else if (saved === 'light') {
+        // Explicit attribute so the prefers-color-scheme CSS fallback
+        // doesn't re-darken the page for OS-dark visitors who chose light
+        document.documentElement.setAttribute('data-theme', 'light');
+    } else if (window.matchMedia('(prefers-color-scheme: dark)').matches) {
+        document.documentElement.setAttribute('data-theme', 'dark');
+    }
+
+    // Sync to both keys for cross-page compatibility
+    if (saved) {
+        localStorage.setItem('theme', saved);
+        localStorage.setItem('policyradar-theme', saved);
+    }
+}
+
+function toggleTheme() {
+    const current = document.documentElement.getAttribute('data-theme');
+    const newTheme = current === 'dark' ? 'light' : 'dark';
+    document.documentElement.setAttribute('data-theme', newTheme);
+    // Sync both localStorage keys
+    localStorage.setItem('theme', newTheme);
+    localStorage.setItem('policyradar-theme', newTheme);
+    // Update mobile drawer button label
+    const mBtn = document.getElementById('mobile-theme-btn');
+    if (mBtn) mBtn.textContent = newTheme === 'dark' ? 'Light Mode' : 'Dark Mode';
+    // Update mobile bottom nav theme button
+    const navLabel = document.getElementById('mobile-nav-theme-label');
+    if (navLabel) navLabel.textContent = newTheme === 'dark' ? 'Light' : 'Dark';
+}
+
+// Listen for system preference changes
+window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', e => {
+    if (!localStorage.getItem('theme') && !localStorage.getItem('policyradar-theme')) {
+        document.documentElement.setAttribute('data-theme', e.matches ? 'dark' : 'light');
+    }
+});
+
+// ========================================
+// UTILITIES
+// ========================================
+// A crawl sees the same handful of source names over and over, so cache
+// the classification per name instead of re-running the regexes.
+const sourceTypeCache = new Map();
+
+function getSourceType(name) {
+    if (!name) return null;
+    if (sourceTypeCache.has(name)) return sourceTypeCache.get(name);
+    const result = classifySource(name);
+    sourceTypeCache.set(name, result);
+    return result;
+}
+
+function classifySource(name) {
+    const n = name.toLowerCase();
+    if (/^(pib|rbi |sebi |trai |cbi |darpg|delhiprison|delhi transport|karnataka\.gov|government of|department of|directorate of)/.test(n)) return { label: 'GOV', cls: 'gov' };
+    if (/^(livelaw|bar and bench|taxguru|legal bites|law insider|law times|iplead|vidhi|scc)/.test(n)) return { label: 'LEGAL', cls: 'legal' };
+    if (/^(mongabay|indiasp|carbon brief|dialogue earth|alt news|citizen matters|the diplomat|world bank)/.test(n)) return { label: 'RESEARCH', cls: 'research' };
+    if (/^(inc42|yourstory|mercom|solarquarter|etenergyworld|pv magazine|the ken|icici direct)/.test(n)) return { label: 'INDUSTRY', cls: 'industry' };
+    return null;
+}
+
+function escapeHtml(text) {
+    if (!text) return '';
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+// Escape for use in JavaScript string literals within HTML attributes (onclick, etc.)
+// Escapes HTML entities AND single quotes to prevent breaking JS strings
+function escapeJsAttr(text) {
+    if (!text) return '';
+    return escapeHtml(text)
+        .replace(/'/g, '&#39;')  // Escape single quotes for JS string literals
+        .replace(/\\/g, '\\\\'); // Escape backslashes
+}
+
+// toLocaleDateString resolves locale data on every call; a shared
+// Intl.DateTimeFormat does that work once for the whole render pass.
+const cardDateFormat = new Intl.DateTimeFormat('en-IN', { month: 'short', day: 'numeric' });
+
+function formatDate(dateStr) {
+    if (!dateStr) return '';
+    const d = new Date(dateStr);
+    return isNaN(d) ? '' : cardDateFormat.format(d);
+}
+
+function truncate(text, maxLength) {
+    if (!text || text.length <= maxLength) return text;
+    return text.substring(0, maxLength).trim() + '...';
+}
+
+function showError(message) {
+    document.getElementById('articles-grid').innerHTML = `
+        <div class="empty-state">
+            <div class="empty-state-icon">⚠️</div>
+            <h3 class="empty-state-title">Something went wrong</h3>
+            <p class="empty-state-description">${escapeHtml(message)}</p>
+            <div class="empty-state-actions">
+                <button class="btn btn-primary" onclick="location.reload()">Refresh page</button>
+            </div>
+        </div>
+    `;
+}
+
+function showToast(message) {
+    const container = document.getElementById('toast-container');
+    const toast = document.createElement('div');
+    toast.className = 'toast';
+    toast.textContent = message;
+    container.appendChild(toast);
+
+    setTimeout(() => toast.remove(), 3000);
+}
+
+function announce(message) {
+    const announcer = document.getElementById('announcements');
+    announcer.textContent = message;
+}
+
+// Mobile filter state (separate from desktop for preview)
+const mobileFilterState = {
+    domain: null,
+    subcategory: null,
+    sourceType: null,
+    time: null
+};
+
+function toggleIntelPopup() {
+    const popup = document.getElementById('intel-popup');
+    const overlay = document.getElementById('intel-popup-overlay');
+    const isVisible = popup.classList.contains('visible');
+    if (isVisible) {
+        popup.classList.remove('visible');
+        overlay.classList.remove('visible');
+    } else {
+        popup.classList.add('visible');
+        overlay.classList.add('visible');
+    }
+}
+
+function closeIntelPopup() {
+    document.getElementById('intel-popup').classList.remove('visible');
+    document.getElementById('intel-popup-overlay').classList.remove('visible');
+}
+
+// Clear popup state when returning via back button (bfcache)
+window.addEventListener('pageshow', function() {
+    closeIntelPopup();
+});
+
+function toggleMobileFilters() {
+    const sheet = document.getElementById('mobile-filter-sheet');
+    const backdrop = document.getElementById('mobile-filter-backdrop');
+    if (sheet) {
+        const isExpanded = sheet.classList.toggle('expanded');
+        if (backdrop) backdrop.classList.toggle('visible', isExpanded);
+    }
+}
+
+function setMobileDomainFilter(domain, element) {
+    mobileFilterState.domain = domain || null;
+    mobileFilterState.subcategory = null; // Reset subcategory
+
+    // Update active states
+    document.querySelectorAll('#mobile-domain-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', chip.dataset.domain === domain);
+    });
+
+    // Show/hide subcategory section
+    const subcategorySection = document.getElementById('mobile-subcategory-section');
+    const subcategoryFilters = document.getElementById('mobile-subcategory-filters');
+
+    if (domain && SUBCATEGORIES[domain]) {
+        subcategorySection.style.display = 'block';
+        const categories = SUBCATEGORIES[domain];
+        const counts = categoryCounts;
+
+        subcategoryFilters.innerHTML = `
+            <button class="mobile-filter-chip active" data-category="" onclick="setMobileSubcategoryFilter('', this)">All</button>
+            ${categories.map(cat => `
+                <button class="mobile-filter-chip" data-category="${escapeHtml(cat)}" onclick="setMobileSubcategoryFilter('${escapeHtml(cat)}', this)">
+                    ${escapeHtml(cat)} <span style="opacity: 0.7">(${counts.get(cat) || 0})</span>
+                </button>
+            `).join('')}
+        `;
+    } else {
+        subcategorySection.style.display = 'none';
+    }
+
+    updateMobileFilterCount();
+}
+
+function setMobileSubcategoryFilter(category, element) {
+    mobileFilterState.subcategory = category || null;
+
+    document.querySelectorAll('#mobile-subcategory-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', chip.dataset.category === category);
+    });
+
+    updateMobileFilterCount();
+}
+
+function setMobileSourceTypeFilter(sourceType, element) {
+    mobileFilterState.sourceType = sourceType || null;
+
+    document.querySelectorAll('#mobile-source-type-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', chip.dataset.sourceType === sourceType);
+    });
+
+    updateMobileFilterCount();
+}
+
+function setMobileTimeFilter(time, element) {
+    mobileFilterState.time = time || null;
+
+    document.querySelectorAll('#mobile-time-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', chip.dataset.time === time);
+    });
+
+    updateMobileFilterCount();
+}
+
+function updateMobileFilterCount() {
+    let count = 0;
+    if (mobileFilterState.domain) count++;
+    if (mobileFilterState.subcategory) count++;
+    if (mobileFilterState.sourceType) count++;
+    if (mobileFilterState.time) count++;
+
+    const countEl = document.getElementById('mobile-filter-count');
+    const clearBtn = document.getElementById('mobile-filter-clear');
+    const navBadge = document.getElementById('active-filter-count');
+
+    if (count > 0) {
+        if (countEl) {
+            countEl.textContent = count;
+            countEl.style.display = 'inline';
+        }
+        if (clearBtn) clearBtn.style.display = 'block';
+        if (navBadge) {
+            navBadge.textContent = count;
+            navBadge.style.display = 'flex';
+        }
+    } else {
+        if (countEl) countEl.style.display = 'none';
+        if (clearBtn) clearBtn.style.display = 'none';
+        if (navBadge) navBadge.style.display = 'none';
+    }
+}
+
+function applyMobileFilters() {
+    // Apply mobile filters to main state
+    state.filters.domain = mobileFilterState.domain;
+    currentSelectedCategory = mobileFilterState.subcategory;
+    state.filters.sourceType = mobileFilterState.sourceType;
+
+    // Apply time filter (uses state.filters.time, not startDate)
+    if (mobileFilterState.time === 'today') {
+        state.filters.time = 'today';
+    } else if (mobileFilterState.time === 'week') {
+        state.filters.time = 'week';
+    } else {
+        state.filters.time = 'all';
+    }
+
+    // Sync desktop UI with new filters
+    document.querySelectorAll('.domain-pill').forEach(pill => {
+        pill.classList.toggle('active', pill.dataset.domain === (state.filters.domain || ''));
+    });
+    document.querySelectorAll('.source-type-pill').forEach(pill => {
+        pill.classList.toggle('active', pill.dataset.sourceType === (state.filters.sourceType || ''));
+    });
+
+    state.currentPage = 1;
+    applyFiltersAndRender();
+
+    // Focus mode: hide overview when filtered, restore on "All"
+    // Runs AFTER render to ensure sections aren't re-shown
+    const hasFilter = state.filters.domain || state.filters.sourceType;
+    ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+        const el = document.getElementById(id);
+        if (el) el.style.display = hasFilter ? 'none' : '';
+    });
+    document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = hasFilter ? 'none' : '');
+    const mainElM = document.getElementById('main-content');
+    if (mainElM) mainElM.style.gridTemplateColumns = hasFilter ? '1fr' : '';
+    document.querySelectorAll('.sidebar').forEach(el => el.style.display = hasFilter ? 'none' : '');
+    const catSummaryRow = document.getElementById('category-summary-row');
+    if (catSummaryRow && state.filters.sourceType) catSummaryRow.style.display = 'none';
+
+    // Collapse the sheet and backdrop
+    const sheet = document.getElementById('mobile-filter-sheet');
+    const backdrop = document.getElementById('mobile-filter-backdrop');
+    if (sheet) sheet.classList.remove('expanded');
+    if (backdrop) backdrop.classList.remove('visible');
+
+    // Scroll to top of results
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+
+function clearAllFilters() {
+    mobileFilterState.domain = null;
+    mobileFilterState.subcategory = null;
+    mobileFilterState.sourceType = null;
+    mobileFilterState.time = null;
+
+    // Reset mobile UI
+    document.querySelectorAll('#mobile-domain-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', !chip.dataset.domain);
+    });
+    document.querySelectorAll('#mobile-source-type-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', !chip.dataset.sourceType);
+    });
+    document.querySelectorAll('#mobile-time-filters .mobile-filter-chip').forEach(chip => {
+        chip.classList.toggle('active', !chip.dataset.time);
+    });
+    document.getElementById('mobile-subcategory-section').style.display = 'none';
+
+    // Sync mobile UPSC tab
+    const mobileTab = document.getElementById('mobile-upsc-tab');
+    if (mobileTab) mobileTab.classList.remove('active');
+
+    updateMobileFilterCount();
+    resetFilters();
+    applyFiltersAndRender();
+
+    // Restore overview sections (exit focus mode)
+    ['hero-section', 'featured-stories', 'category-briefings-section'].forEach(id => {
+        const el = document.getElementById(id);
+        if (el) el.style.display = '';
+    });
+    document.querySelectorAll('.newsletter-banner').forEach(el => el.style.display = '');
+    const mainEl = document.getElementById('main-content');
+    if (mainEl) mainEl.style.gridTemplateColumns = '';
+    document.querySelectorAll('.sidebar').forEach(el => el.style.display = '');
+
+    // Collapse sheet and backdrop after clearing
+    const sheet = document.getElementById('mobile-filter-sheet');
+    const backdrop = document.getElementById('mobile-filter-backdrop');
+    if (sheet) sheet.classList.remove('expanded');
+    if (backdrop) backdrop.classList.remove('visible');
+}
+
+// Expose functions globally
+window.applyFiltersAndRender = applyFiltersAndRender;
+window.escapeHtml = escapeHtml;
+window.showToast = showToast;
+window.renderArticleCard = renderArticleCard;
+window.CONFIG = CONFIG;
+window.state = state;
+
+// Mobile Drawer Functions
+function openMDrawer() {
+    document.getElementById('mDrawer').classList.add('active');
+    document.getElementById('mDrawerOverlay').classList.add('active');
+    document.body.style.overflow = 'hidden';
+    syncMDrawer();
+}
+function closeMDrawer() {
+    document.getElementById('mDrawer').classList.remove('active');
+    document.getElementById('mDrawerOverlay').classList.remove('active');
+    document.body.style.overflow = '';
+}
+function syncMDrawer() {
+    // Sync theme nav label
+    var navLabel = document.getElementById('mobile-nav-theme-label');
+    if (navLabel) navLabel.textContent = document.documentElement.getAttribute('data-theme') === 'dark' ? 'Light' : 'Dark';
+    // Render trending
+    var tEl = document.getElementById('mTrendList');
+    if (state.trendingTopics && state.trendingTopics.length > 0) {
+        tEl.innerHTML = state.trendingTopics.slice(0,8).map(function(tp,i){
+            var nm = tp.topic || tp.name || '';
+            var ct = tp.count || tp.article_count || 0;
+            var ac = state.filters.trendingIndex === i ? ' active' : '';
+            return '<button class="mtrend-btn'+ac+'" onclick="mTrendTap('+i+')"><span style="min-width:20px;color:var(--text-muted)">'+(i+1)+'</span><span style="flex:1">'+escapeHtml(nm)+'</span><span style="color:var(--text-muted)">'+ct+'</span></button>';
+        }).join('');
+    } else {
+        tEl.innerHTML = '<p style="color:var(--text-muted);font-size:0.85rem">No trending topics</p>';
+    }
+}
+function mTrendTap(idx) {
+    var tp = state.trendingTopics && state.trendingTopics[idx];
+    if (tp) {
+        var keyword = tp.topic || tp.name || '';
+        if (keyword) filterByKeyword(keyword);
+    }
+    closeMDrawer();
+}
+window.openMDrawer = openMDrawer;
+window.closeMDrawer = closeMDrawer;
+window.mTrendTap = mTrendTap;
@@ -0,0 +1,11 @@
+/**
+ * PolicyRadar - Theme bootstrap for static pages
+ * Syncs the saved theme (or OS preference) before first paint.
+ * Loaded synchronously in <head> so the page never flashes the
+ * wrong palette; shared and cached across about/privacy/terms.
+ */
+(function() {
+    const saved = localStorage.getItem('theme') || localStorage.getItem('policyradar-theme');
+    if (saved) document.documentElement.setAttribute('data-theme', saved);
+    else if (window.matchMedia('(prefers-color-scheme: dark)').matches) document.documentElement.setAttribute('data-theme', 'dark');
+})();
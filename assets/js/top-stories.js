@@ -317,10 +317,20 @@
             const state = window.state;
             if (!state || !state.allArticles) return [];
 
-            return state.allArticles
-                .filter(a => a.is_breaking || a.is_high_impact)
-                .sort((a, b) => (b.relevance_score || 0) - (a.relevance_score || 0))
-                .slice(0, CONFIG.maxTickerItems);
+            // Bounded top-N selection: keep a small sorted window instead of
+            // sorting the whole article list just to take the first few.
+            const limit = CONFIG.maxTickerItems;
+            const top = [];
+            for (const a of state.allArticles) {
+                if (!a.is_breaking && !a.is_high_impact) continue;
+                const score = a.relevance_score || 0;
+                if (top.length === limit && score <= (top[limit - 1].relevance_score || 0)) continue;
+                let i = top.length;
+                while (i > 0 && (top[i - 1].relevance_score || 0) < score) i--;
+                top.splice(i, 0, a);
+                if (top.length > limit) top.pop();
+            }
+            return top;
         },
 
         render() {
@@ -18,9 +18,19 @@ const HTML_CACHE = `${CACHE_VERSION}-html`;
 const STATIC_ASSETS = [
     '/',
     '/index.html',
-    // Add any CSS/JS files if you have external ones
+    '/assets/css/main.css',
+    '/assets/js/app.js',
 ];
 
+// App-shell assets that change with deploys. These are precached above
+// for offline use, but must be served stale-while-revalidate — cache
+// first would pin returning visitors to an old bundle (and its
+// data/*.json schema expectations) until CACHE_VERSION is bumped.
+const APP_SHELL_ASSETS = new Set([
+    '/assets/css/main.css',
+    '/assets/js/app.js',
+]);
+
 // Data endpoints to cache
 const DATA_ENDPOINTS = [
     '/data/initial.json',
@@ -99,6 +109,8 @@ self.addEventListener('fetch', (event) => {
     // Route to appropriate strategy
     if (isDataRequest(url)) {
         event.respondWith(networkFirstStrategy(event.request, DATA_CACHE));
+    } else if (APP_SHELL_ASSETS.has(url.pathname)) {
+        event.respondWith(staleWhileRevalidateStrategy(event.request, STATIC_CACHE));
     } else if (isHTMLRequest(event.request)) {
         event.respondWith(staleWhileRevalidateStrategy(event.request, HTML_CACHE));
     } else if (isStaticAsset(url)) {